@@ -2,6 +2,8 @@
 Example usage of technical analysis indicators
 """
 
+import numpy as np
+
 from finance_service import TechnicalIndicators
 
 
@@ -25,7 +27,7 @@ def main():
     print(f"\nPrice | EMA")
     print("-" * 20)
     for i, (price, ema) in enumerate(zip(prices, ema_values), 1):
-        if ema is None:
+        if np.isnan(ema):
             print(f"{price:6.2f} | N/A (warming up)")
         else:
             print(f"{price:6.2f} | {ema:6.2f}")
@@ -70,9 +72,9 @@ def main():
         ema5 = medium_ema[i]
         ema10 = long_ema[i]
 
-        ema3_str = f"{ema3:6.2f}" if ema3 is not None else "   N/A"
-        ema5_str = f"{ema5:6.2f}" if ema5 is not None else "   N/A"
-        ema10_str = f"{ema10:6.2f}" if ema10 is not None else "   N/A"
+        ema3_str = f"{ema3:6.2f}" if not np.isnan(ema3) else "   N/A"
+        ema5_str = f"{ema5:6.2f}" if not np.isnan(ema5) else "   N/A"
+        ema10_str = f"{ema10:6.2f}" if not np.isnan(ema10) else "   N/A"
 
         print(f"{price:6.2f} | {ema3_str} | {ema5_str} | {ema10_str}")
 
@@ -95,7 +97,7 @@ def main():
         fast = fast_ema[i]
         slow = slow_ema[i]
 
-        if fast is not None and slow is not None:
+        if not np.isnan(fast) and not np.isnan(slow):
             if fast > slow:
                 signal = "BULLISH ↑"
             elif fast < slow:
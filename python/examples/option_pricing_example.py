@@ -109,6 +109,25 @@ def main():
     print(f"  Option Price: ${div_result.price:.2f}")
     print(f"  Delta: {div_result.delta:.4f}")
 
+    # Example 5: Batch pricing an option chain
+    print("\n5. Batch Pricing an Option Chain:")
+    print("-" * 60)
+    strikes = [90.0, 95.0, 100.0, 105.0, 110.0]
+    chain = OptionPricer.price_options_batch(
+        spot_prices=100.0,
+        strike_prices=strikes,
+        times_to_expiry=0.5,  # 6 months
+        risk_free_rates=0.05,  # 5%
+        volatilities=0.2,  # 20%
+        option_types=OptionType.CALL,
+    )
+    print("Spot Price: $100.00")
+    print("Time to Expiry: 0.5 years (6 months)")
+    print("\nStrike  | Price  | Delta")
+    print("-" * 30)
+    for strike, price, delta in zip(strikes, chain.price, chain.delta):
+        print(f"{strike:7.2f} | {price:6.2f} | {delta:.4f}")
+
     print("\n" + "=" * 60)
 
 
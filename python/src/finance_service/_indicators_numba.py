@@ -0,0 +1,154 @@
+"""
+Numba fallback for the technical indicators
+
+Mirrors the ``pyfinance.EMA`` and ``pyfinance.SMA`` classes so that
+``indicators.py`` can use this module as a drop-in replacement when the Rust
+extension has not been built. The batch EMA recurrence is compiled to machine
+code with ``numba.njit``; streaming updates are O(1) and stay in Python.
+"""
+
+from collections import deque
+from typing import Deque, List, Optional
+
+import numpy as np
+
+try:
+    import numba
+except ImportError as e:  # pragma: no cover - depends on the environment
+    raise ImportError(
+        "finance_service needs either the pyfinance Rust extension "
+        "(build it with `maturin develop`) or numba (`pip install numba`)"
+    ) from e
+
+
+@numba.njit(cache=True, fastmath=True, nogil=True)
+def ema_core(
+    prices: np.ndarray, period: int, alpha: float, one_minus_alpha: float, out: np.ndarray
+) -> None:
+    """
+    Write EMA values for ``prices[period-1:]`` into ``out[period-1:]``.
+
+    The first EMA value is the SMA of the first ``period`` prices, matching
+    the Rust implementation. Warmup slots of ``out`` are left untouched.
+    """
+    prev_ema = 0.0
+    for i in range(period):
+        prev_ema += prices[i]
+    prev_ema /= period
+    out[period - 1] = prev_ema
+
+    for i in range(period, len(prices)):
+        prev_ema = alpha * prices[i] + one_minus_alpha * prev_ema
+        out[i] = prev_ema
+
+
+class EMA:
+    """Numba-backed stand-in for ``pyfinance.EMA``"""
+
+    def __init__(self, period: int, seed: Optional[float] = None):
+        if period <= 0:
+            raise ValueError("EMA creation error: Invalid parameter: Period must be greater than 0")
+        self._period = period
+        self._alpha = 2.0 / (period + 1.0)
+        self._one_minus_alpha = 1.0 - self._alpha
+        self._current = seed
+
+    def calculate_np(self, prices: np.ndarray) -> np.ndarray:
+        """Calculate EMA for a float64 array; warmup values are NaN"""
+        if len(prices) < self._period:
+            raise ValueError(
+                "EMA calculation error: Insufficient data: "
+                f"Need at least {self._period} data points, got {len(prices)}"
+            )
+        out = np.empty(len(prices), dtype=np.float64)
+        out[: self._period - 1] = np.nan
+        ema_core(prices, self._period, self._alpha, self._one_minus_alpha, out)
+        return out
+
+    def calculate(self, prices: List[float]) -> np.ndarray:
+        """Calculate EMA for a list; warmup values are NaN"""
+        return self.calculate_np(np.asarray(prices, dtype=np.float64))
+
+    def update(self, new_price: float) -> float:
+        """Update the streaming EMA with a new price"""
+        if self._current is None:
+            self._current = new_price
+        else:
+            self._current = self._alpha * new_price + self._one_minus_alpha * self._current
+        return self._current
+
+    def reset(self) -> None:
+        """Reset the streaming state"""
+        self._current = None
+
+    @property
+    def current(self) -> Optional[float]:
+        """Current streaming EMA value, or None before the first update"""
+        return self._current
+
+    @current.setter
+    def current(self, value: Optional[float]) -> None:
+        self._current = value
+
+    @property
+    def period(self) -> int:
+        """Period used for EMA calculation"""
+        return self._period
+
+    @property
+    def alpha(self) -> float:
+        """Smoothing factor (alpha) used for EMA calculation"""
+        return self._alpha
+
+    def __repr__(self) -> str:
+        return f"EMA(period={self._period})"
+
+
+class SMA:
+    """Stand-in for ``pyfinance.SMA``"""
+
+    def __init__(self, period: int):
+        if period <= 0:
+            raise ValueError("SMA creation error: Invalid parameter: Period must be greater than 0")
+        self._period = period
+        self._window: Deque[float] = deque()
+        self._sum = 0.0
+        self._compensation = 0.0
+
+    def update(self, new_price: float) -> Optional[float]:
+        """Update the streaming SMA with a new price"""
+        if len(self._window) == self._period:
+            self._accumulate(-self._window.popleft())
+        self._window.append(new_price)
+        self._accumulate(new_price)
+        return self.current
+
+    def _accumulate(self, value: float) -> None:
+        """Add ``value`` to the running sum with Neumaier compensation, as in Rust"""
+        total = self._sum + value
+        if abs(self._sum) >= abs(value):
+            self._compensation += (self._sum - total) + value
+        else:
+            self._compensation += (value - total) + self._sum
+        self._sum = total
+
+    def reset(self) -> None:
+        """Reset the streaming state"""
+        self._window.clear()
+        self._sum = 0.0
+        self._compensation = 0.0
+
+    @property
+    def current(self) -> Optional[float]:
+        """Current SMA value, or None until ``period`` prices have been seen"""
+        if len(self._window) < self._period:
+            return None
+        return (self._sum + self._compensation) / self._period
+
+    @property
+    def period(self) -> int:
+        """Period used for SMA calculation"""
+        return self._period
+
+    def __repr__(self) -> str:
+        return f"SMA(period={self._period})"
@@ -0,0 +1,167 @@
+"""
+Monte Carlo option pricing
+
+Simulates geometric Brownian motion paths and prices the option as the
+discounted mean payoff. European options are priced from the terminal value
+alone, on the CPU with NumPy or on an NVIDIA GPU with the ``numba.cuda``
+kernel in ``_monte_carlo_cuda``.
+American options are priced on the CPU with the Longstaff-Schwartz regression
+method.
+
+Greeks are finite differences of prices that reuse the same random numbers
+(common random numbers), so the simulation noise largely cancels between the
+bumped prices. Antithetic variates halve the number of normal draws and reduce
+the variance of every price.
+
+Inputs are validated by the service layer before they reach this module.
+"""
+
+import math
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .pricing import PricingResult
+
+# Finite-difference bumps: 1% of spot, one volatility point, one rate point
+_SPOT_BUMP = 0.01
+_VOL_BUMP = 0.01
+_RATE_BUMP = 0.01
+# Calendar step for theta, shortened for options about to expire
+_THETA_DT = 1.0 / 365.0
+
+# Scenario order: base, spot up/down, vol up/down, rate up/down, shorter expiry
+_N_SCENARIOS = 8
+
+
+def _scenarios(
+    spot_price: float,
+    time_to_expiry: float,
+    risk_free_rate: float,
+    volatility: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Return spot, rate, volatility and expiry of every scenario as arrays"""
+    h_spot = _SPOT_BUMP * spot_price
+    vol_down = max(volatility - _VOL_BUMP, 0.0)
+    theta_dt = min(_THETA_DT, 0.5 * time_to_expiry)
+
+    s, r, v, t = spot_price, risk_free_rate, volatility, time_to_expiry
+    spot = np.array([s, s + h_spot, s - h_spot, s, s, s, s, s])
+    rate = np.array([r, r, r, r, r, r + _RATE_BUMP, r - _RATE_BUMP, r])
+    vol = np.array([v, v, v, v + _VOL_BUMP, vol_down, v, v, v])
+    expiry = np.array([t, t, t, t, t, t, t, t - theta_dt])
+    return spot, rate, vol, expiry
+
+
+def _greeks(
+    prices: np.ndarray, spot: np.ndarray, vol: np.ndarray, expiry: np.ndarray
+) -> PricingResult:
+    """Turn the scenario prices into price and Greeks, in ``PricingResult`` units"""
+    h_spot = spot[1] - spot[0]
+    return PricingResult(
+        price=float(prices[0]),
+        delta=float((prices[1] - prices[2]) / (2.0 * h_spot)),
+        gamma=float((prices[1] - 2.0 * prices[0] + prices[2]) / (h_spot * h_spot)),
+        theta=float((prices[7] - prices[0]) / (expiry[0] - expiry[7])),
+        # Vega and rho are divided by 100 to express them per 1% change
+        vega=float((prices[3] - prices[4]) / (vol[3] - vol[4]) / 100.0),
+        rho=float((prices[5] - prices[6]) / (2.0 * _RATE_BUMP) / 100.0),
+    )
+
+
+def _antithetic_normals(rng: np.random.Generator, shape: Tuple[int, ...]) -> np.ndarray:
+    """Draw standard normals for half the paths along the last axis and mirror them"""
+    half = rng.standard_normal(shape[:-1] + (shape[-1] // 2,))
+    return np.concatenate([half, -half], axis=-1)
+
+
+def _european_cpu(
+    strike_price: float,
+    dividend_yield: float,
+    sign: float,
+    scenarios: Tuple[np.ndarray, ...],
+    n_paths: int,
+    seed: Optional[int],
+) -> np.ndarray:
+    """Price a European option in every scenario with NumPy"""
+    z = _antithetic_normals(np.random.default_rng(seed), (n_paths,))
+    prices = np.empty(_N_SCENARIOS)
+    for j, (s, r, v, t) in enumerate(zip(*scenarios)):
+        terminal = s * np.exp((r - dividend_yield - 0.5 * v * v) * t + v * math.sqrt(t) * z)
+        payoff = np.maximum(sign * (terminal - strike_price), 0.0)
+        prices[j] = math.exp(-r * t) * payoff.mean()
+    return prices
+
+
+def _american_cpu(
+    strike_price: float,
+    dividend_yield: float,
+    sign: float,
+    scenarios: Tuple[np.ndarray, ...],
+    n_paths: int,
+    n_steps: int,
+    seed: Optional[int],
+) -> np.ndarray:
+    """Price an American option in every scenario with Longstaff-Schwartz"""
+    z = _antithetic_normals(np.random.default_rng(seed), (n_steps, n_paths))
+    prices = np.empty(_N_SCENARIOS)
+    for j, (s, r, v, t) in enumerate(zip(*scenarios)):
+        dt = t / n_steps
+        discount = math.exp(-r * dt)
+        log_steps = (r - dividend_yield - 0.5 * v * v) * dt + v * math.sqrt(dt) * z
+        # Row i holds the prices at time (i + 1) * dt
+        paths = s * np.exp(np.cumsum(log_steps, axis=0))
+
+        # Cash flow of each path under the exercise policy found so far
+        cash = np.maximum(sign * (paths[-1] - strike_price), 0.0)
+        for step in range(n_steps - 2, -1, -1):
+            cash *= discount
+            exercise = np.maximum(sign * (paths[step] - strike_price), 0.0)
+            in_the_money = np.flatnonzero(exercise > 0.0)
+            if len(in_the_money) < 3:
+                continue
+
+            # Regress continuation values on 1, x and x^2 over in-the-money paths
+            x = paths[step, in_the_money] / strike_price
+            basis = np.column_stack([np.ones_like(x), x, x * x])
+            coef, *_ = np.linalg.lstsq(basis, cash[in_the_money], rcond=None)
+            exercise_now = exercise[in_the_money] > basis @ coef
+            exercised = in_the_money[exercise_now]
+            cash[exercised] = exercise[exercised]
+
+        # The holder may also exercise immediately
+        prices[j] = max(discount * cash.mean(), max(sign * (s - strike_price), 0.0))
+    return prices
+
+
+def price(
+    spot_price: float,
+    strike_price: float,
+    time_to_expiry: float,
+    risk_free_rate: float,
+    volatility: float,
+    dividend_yield: float,
+    is_call: bool,
+    n_paths: int,
+    n_steps: int,
+    american: bool,
+    device: str,
+    seed: Optional[int],
+) -> PricingResult:
+    """Price an option and its Greeks by Monte Carlo"""
+    sign = 1.0 if is_call else -1.0
+    scenarios = _scenarios(spot_price, time_to_expiry, risk_free_rate, volatility)
+
+    if american:
+        prices = _american_cpu(
+            strike_price, dividend_yield, sign, scenarios, n_paths, n_steps, seed
+        )
+    elif device == "cuda":
+        from ._monte_carlo_cuda import european_prices
+
+        prices = european_prices(strike_price, dividend_yield, sign, scenarios, n_paths, seed)
+    else:
+        prices = _european_cpu(strike_price, dividend_yield, sign, scenarios, n_paths, seed)
+
+    spot, _, vol, expiry = scenarios
+    return _greeks(prices, spot, vol, expiry)
@@ -0,0 +1,79 @@
+"""
+CUDA kernel for Monte Carlo pricing of European options
+
+Imported by ``_monte_carlo`` only when ``device="cuda"`` is requested, so
+that CPU-only users never import ``numba.cuda``.
+"""
+
+import math
+from typing import Optional, Tuple
+
+import numpy as np
+
+try:
+    from numba import cuda
+    from numba.cuda.random import create_xoroshiro128p_states, xoroshiro128p_normal_float64
+except ImportError as e:  # pragma: no cover - depends on the environment
+    raise ImportError("device='cuda' requires numba with CUDA support (`pip install numba`)") from e
+
+from ._monte_carlo import _N_SCENARIOS
+
+# Threads per block and maximum number of blocks
+_THREADS = 256
+_MAX_BLOCKS = 1024
+
+
+@cuda.jit(device=True)
+def _payoff(z, strike, div, sign, spot, rate, vol, expiry):
+    """Payoff at expiry of the path with standard normal draw ``z``"""
+    terminal = spot * math.exp((rate - div - 0.5 * vol * vol) * expiry + vol * math.sqrt(expiry) * z)
+    return max(sign * (terminal - strike), 0.0)
+
+
+@cuda.jit
+def _european_kernel(rng_states, n_pairs, strike, div, sign, spot, rate, vol, expiry, sums):
+    """Write each thread's payoff sum in every scenario to ``sums[scenario, thread]``
+
+    Threads walk over the antithetic path pairs with a grid stride, so the
+    grid size does not depend on ``n_pairs``.
+    """
+    tid = cuda.grid(1)
+    acc = cuda.local.array(_N_SCENARIOS, np.float64)
+    for j in range(_N_SCENARIOS):
+        acc[j] = 0.0
+
+    for _ in range(tid, n_pairs, cuda.gridsize(1)):
+        z = xoroshiro128p_normal_float64(rng_states, tid)
+        for j in range(_N_SCENARIOS):
+            acc[j] += _payoff(z, strike, div, sign, spot[j], rate[j], vol[j], expiry[j])
+            acc[j] += _payoff(-z, strike, div, sign, spot[j], rate[j], vol[j], expiry[j])
+
+    for j in range(_N_SCENARIOS):
+        sums[j, tid] = acc[j]
+
+
+def european_prices(
+    strike_price: float,
+    dividend_yield: float,
+    sign: float,
+    scenarios: Tuple[np.ndarray, ...],
+    n_paths: int,
+    seed: Optional[int],
+) -> np.ndarray:
+    """Price a European option in every scenario on the GPU"""
+    n_pairs = n_paths // 2
+    blocks = min(-(-n_pairs // _THREADS), _MAX_BLOCKS)
+    n_threads = blocks * _THREADS
+
+    rng_seed = int(np.random.default_rng(seed).integers(2**63))
+    rng_states = create_xoroshiro128p_states(n_threads, seed=rng_seed)
+    spot, rate, vol, expiry = (cuda.to_device(a) for a in scenarios)
+    sums = cuda.device_array((_N_SCENARIOS, n_threads), dtype=np.float64)
+
+    _european_kernel[blocks, _THREADS](
+        rng_states, n_pairs, strike_price, dividend_yield, sign, spot, rate, vol, expiry, sums
+    )
+
+    # Only one partial sum per thread and scenario comes back to the host
+    mean_payoff = sums.copy_to_host().sum(axis=1) / (2 * n_pairs)
+    return np.exp(-scenarios[1] * scenarios[3]) * mean_payoff
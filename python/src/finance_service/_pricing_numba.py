@@ -0,0 +1,218 @@
+"""
+Numba fallback for Black-Scholes option pricing
+
+Mirrors the pricing functions of the ``pyfinance`` extension so that
+``pricing.py`` can use this module as a drop-in replacement when the Rust
+extension has not been built. A single ``numba.njit`` kernel computes the
+price and all Greeks from shared intermediate values, using the same
+Abramowitz-Stegun normal CDF approximation as the Rust kernels.
+
+Inputs are validated by the service layer before they reach this module.
+"""
+
+import math
+from collections import namedtuple
+from typing import Dict
+
+import numpy as np
+
+try:
+    import numba
+except ImportError as e:  # pragma: no cover - depends on the environment
+    raise ImportError(
+        "finance_service needs either the pyfinance Rust extension "
+        "(build it with `maturin develop`) or numba (`pip install numba`)"
+    ) from e
+
+
+PricingResult = namedtuple("PricingResult", ["price", "delta", "gamma", "theta", "vega", "rho"])
+
+_FRAC_1_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+
+# Coefficients of the Abramowitz-Stegun 26.2.17 approximation
+_AS_P = 0.2316419
+_AS_B1, _AS_B2, _AS_B3, _AS_B4, _AS_B5 = (
+    0.319381530,
+    -0.356563782,
+    1.781477937,
+    -1.821255978,
+    1.330274429,
+)
+
+
+@numba.njit(cache=True, fastmath=True)
+def _norm_cdf_with_pdf(x: float, pdf: float) -> float:
+    """Standard normal CDF given the precomputed density ``pdf = n(x)``"""
+    k = 1.0 / (1.0 + _AS_P * abs(x))
+    poly = ((((_AS_B5 * k + _AS_B4) * k + _AS_B3) * k + _AS_B2) * k + _AS_B1) * k
+    return 0.5 + math.copysign(0.5 - pdf * poly, x)
+
+
+@numba.njit(cache=True, fastmath=True, nogil=True)
+def price_kernel(
+    spot: np.ndarray,
+    strike: np.ndarray,
+    expiry: np.ndarray,
+    rate: np.ndarray,
+    vol: np.ndarray,
+    div: np.ndarray,
+    is_call: np.ndarray,
+    out: np.ndarray,
+) -> None:
+    """
+    Write price, delta, gamma, theta, vega and rho into the rows of ``out``.
+
+    ``out`` must have shape ``(6, n)``. Vega and rho are per 1% change, and
+    expired contracts are priced at their intrinsic value, as in Rust.
+    """
+    for i in range(len(spot)):
+        s = spot[i]
+        k = strike[i]
+        t = expiry[i]
+        r = rate[i]
+        sigma = vol[i]
+        q = div[i]
+        sign = 1.0 if is_call[i] else -1.0
+
+        if t == 0.0:
+            intrinsic = max(sign * (s - k), 0.0)
+            out[0, i] = intrinsic
+            out[1, i] = sign if intrinsic > 0.0 else 0.0
+            for row in range(2, 6):
+                out[row, i] = 0.0
+            continue
+
+        sqrt_t = math.sqrt(t)
+        sigma_sqrt_t = sigma * sqrt_t
+        d1 = (math.log(s / k) + (r - q + 0.5 * sigma * sigma) * t) / sigma_sqrt_t
+        d2 = d1 - sigma_sqrt_t
+
+        disc_r = math.exp(-r * t)
+        disc_q = math.exp(-q * t)
+        pdf_d1 = math.exp(-0.5 * d1 * d1) * _FRAC_1_SQRT_2PI
+        # n(d2) = n(d1) S e^(-qT) / (K e^(-rT)), which saves an exp
+        pdf_d2 = pdf_d1 * (s * disc_q) / (k * disc_r)
+        n1 = _norm_cdf_with_pdf(sign * d1, pdf_d1)
+        n2 = _norm_cdf_with_pdf(sign * d2, pdf_d2)
+
+        spot_term = s * disc_q * n1
+        strike_term = k * disc_r * n2
+
+        out[0, i] = sign * (spot_term - strike_term)
+        out[1, i] = sign * disc_q * n1
+        out[2, i] = disc_q * pdf_d1 / (s * sigma_sqrt_t)
+        out[3, i] = -s * pdf_d1 * sigma * disc_q / (2.0 * sqrt_t) + sign * (
+            q * spot_term - r * strike_term
+        )
+        out[4, i] = s * disc_q * pdf_d1 * sqrt_t / 100.0
+        out[5, i] = sign * strike_term * t / 100.0
+
+
+def _price_columns(
+    spot_prices: np.ndarray,
+    strike_prices: np.ndarray,
+    times_to_expiry: np.ndarray,
+    risk_free_rates: np.ndarray,
+    volatilities: np.ndarray,
+    dividend_yields: np.ndarray,
+    is_call: np.ndarray,
+) -> np.ndarray:
+    out = np.empty((6, len(spot_prices)), dtype=np.float64)
+    price_kernel(
+        np.asarray(spot_prices, dtype=np.float64),
+        np.asarray(strike_prices, dtype=np.float64),
+        np.asarray(times_to_expiry, dtype=np.float64),
+        np.asarray(risk_free_rates, dtype=np.float64),
+        np.asarray(volatilities, dtype=np.float64),
+        np.asarray(dividend_yields, dtype=np.float64),
+        np.asarray(is_call, dtype=np.bool_),
+        out,
+    )
+    return out
+
+
+def price_option(
+    spot_price: float,
+    strike_price: float,
+    time_to_expiry: float,
+    risk_free_rate: float,
+    volatility: float,
+    dividend_yield: float,
+    option_type: str,
+) -> PricingResult:
+    """Numba-backed stand-in for ``pyfinance.price_option``"""
+    option_type = option_type.lower()
+    if option_type not in ("call", "put"):
+        raise ValueError("option_type must be 'call' or 'put'")
+
+    out = _price_columns(
+        np.array([spot_price]),
+        np.array([strike_price]),
+        np.array([time_to_expiry]),
+        np.array([risk_free_rate]),
+        np.array([volatility]),
+        np.array([dividend_yield]),
+        np.array([option_type == "call"]),
+    )
+    return PricingResult(*out[:, 0].tolist())
+
+
+def price_option_pos(
+    spot: float,
+    strike: float,
+    t: float,
+    r: float,
+    sigma: float,
+    q: float,
+    is_call: bool,
+    /,
+) -> PricingResult:
+    """Numba-backed stand-in for ``pyfinance.price_option_pos``"""
+    out = _price_columns(
+        np.array([spot]),
+        np.array([strike]),
+        np.array([t]),
+        np.array([r]),
+        np.array([sigma]),
+        np.array([q]),
+        np.array([is_call]),
+    )
+    return PricingResult(*out[:, 0].tolist())
+
+
+def price_options_batch(**arrays: np.ndarray) -> Dict[str, np.ndarray]:
+    """Numba-backed stand-in for ``pyfinance.price_options_batch``"""
+    out = _price_columns(**arrays)
+    return dict(zip(PricingResult._fields, out))
+
+
+def price_options_batch_f32(**arrays: np.ndarray) -> Dict[str, np.ndarray]:
+    """Numba-backed stand-in for ``pyfinance.price_options_batch_f32``
+
+    The kernel runs in double precision; results are rounded to float32.
+    """
+    out = _price_columns(**arrays).astype(np.float32)
+    return dict(zip(PricingResult._fields, out))
+
+
+def price_strike_ladder(
+    spot_price: float,
+    strike_prices: np.ndarray,
+    time_to_expiry: float,
+    risk_free_rate: float,
+    volatility: float,
+    dividend_yield: float,
+    is_call: bool,
+) -> Dict[str, np.ndarray]:
+    """Numba-backed stand-in for ``pyfinance.price_strike_ladder``"""
+    n = len(strike_prices)
+    out = _price_columns(
+        np.full(n, spot_price),
+        strike_prices,
+        np.full(n, time_to_expiry),
+        np.full(n, risk_free_rate),
+        np.full(n, volatility),
+        np.full(n, dividend_yield),
+        np.full(n, is_call),
+    )
+    return dict(zip(PricingResult._fields, out))
@@ -2,9 +2,14 @@
 Technical analysis indicators service using Rust backend
 """
 
-from typing import List, Optional
+from typing import Optional, Sequence, Union
 
-import pyfinance
+import numpy as np
+
+try:
+    import pyfinance
+except ImportError:  # Rust extension not built; use the Numba kernels instead
+    from . import _indicators_numba as pyfinance  # type: ignore[no-redef]
 
 
 class TechnicalIndicators:
@@ -22,20 +27,24 @@ class TechnicalIndicators:
     """
 
     @staticmethod
-    def ema(prices: List[float], period: int) -> List[Optional[float]]:
+    def ema(prices: Union[Sequence[float], np.ndarray], period: int) -> np.ndarray:
         """
         Calculate Exponential Moving Average (EMA) for a series of prices.
 
         EMA gives more weight to recent prices and responds more quickly to
         price changes than a simple moving average.
 
+        Prices are handed to Rust as a contiguous float64 array and the
+        result comes back as one, so no Python float is created per value.
+
         Args:
-            prices: List of price values
+            prices: Sequence or one-dimensional NumPy array of price values
             period: Number of periods for EMA calculation (must be > 0)
 
         Returns:
-            List of EMA values. The first (period-1) values will be None
-            as there isn't enough data to calculate EMA.
+            float64 array of EMA values with the same length as ``prices``.
+            The first (period-1) values will be NaN as there isn't enough
+            data to calculate EMA; test for them with ``np.isnan(x)``.
 
         Raises:
             ValueError: If period is invalid or insufficient data
@@ -44,21 +53,72 @@ class TechnicalIndicators:
             >>> indicators = TechnicalIndicators()
             >>> prices = [10.0, 11.0, 12.0, 13.0, 14.0]
             >>> ema_values = indicators.ema(prices, period=3)
-            >>> # First two values are None, then EMA starts
-            >>> assert ema_values[0] is None
-            >>> assert ema_values[1] is None
-            >>> assert ema_values[2] is not None
+            >>> # First two values are NaN, then EMA starts
+            >>> assert np.isnan(ema_values[0])
+            >>> assert np.isnan(ema_values[1])
+            >>> assert not np.isnan(ema_values[2])
         """
         if period <= 0:
             raise ValueError("Period must be greater than 0")
-        if len(prices) < period:
-            raise ValueError(f"Need at least {period} data points, got {len(prices)}")
+        values = np.ascontiguousarray(prices, dtype=np.float64)
+        if values.ndim != 1:
+            raise ValueError("Prices must be a one-dimensional sequence")
+        if len(values) < period:
+            raise ValueError(f"Need at least {period} data points, got {len(values)}")
 
         ema_calculator = pyfinance.EMA(period=period)
-        return ema_calculator.calculate(prices)
+        return ema_calculator.calculate_np(values)
+
+    @staticmethod
+    def ema_latest(prices: Union[Sequence[float], np.ndarray], period: int) -> float:
+        """
+        Calculate only the most recent EMA value of a price series.
+
+        Unrolling the EMA recurrence turns the latest value into a single
+        weighted sum of the prices: the SMA seed of the first ``period``
+        prices is weighted by ``(1 - alpha) ** m`` and the ``m`` prices after
+        it by ``alpha * (1 - alpha) ** k``, where ``k`` counts steps back from
+        the end. Evaluating that sum as one dot product avoids the sequential
+        dependency of the recurrence, which matters for long histories when
+        only the final value is needed.
+
+        Args:
+            prices: Sequence or array of price values
+            period: Number of periods for EMA calculation (must be > 0)
+
+        Returns:
+            The last EMA value, equal to ``ema(prices, period)[-1]`` up to
+            floating-point rounding
+
+        Raises:
+            ValueError: If period is invalid or insufficient data
+
+        Example:
+            >>> indicators = TechnicalIndicators()
+            >>> prices = [10.0, 11.0, 12.0, 13.0, 14.0]
+            >>> indicators.ema_latest(prices, period=3)
+            13.0
+        """
+        if period <= 0:
+            raise ValueError("Period must be greater than 0")
+        values = np.asarray(prices, dtype=np.float64)
+        if values.ndim != 1:
+            raise ValueError("Prices must be a one-dimensional sequence")
+        if len(values) < period:
+            raise ValueError(f"Need at least {period} data points, got {len(values)}")
+
+        alpha = 2.0 / (period + 1.0)
+        steps = len(values) - period
+
+        weights = np.empty(len(values))
+        # Each seed price contributes 1/period of the SMA seed
+        weights[:period] = (1.0 - alpha) ** steps / period
+        weights[period:] = alpha * (1.0 - alpha) ** np.arange(steps - 1, -1, -1)
+
+        return float(weights @ values)
 
     @staticmethod
-    def ema_streaming(period: int) -> "EMACalculator":
+    def ema_streaming(period: int, seed: Optional[float] = None) -> "EMACalculator":
         """
         Create a streaming EMA calculator for real-time updates.
 
@@ -67,6 +127,9 @@ class TechnicalIndicators:
 
         Args:
             period: Number of periods for EMA calculation
+            seed: Optional starting EMA value, for example one saved with
+                ``EMACalculator.dump_state`` before a restart. Without a
+                seed the first update starts the EMA at that price.
 
         Returns:
             EMACalculator instance for streaming calculations
@@ -79,7 +142,31 @@ class TechnicalIndicators:
             >>> calculator.update(102.0)
             101.818...
         """
-        return EMACalculator(period)
+        return EMACalculator(period, seed=seed)
+
+    @staticmethod
+    def sma_streaming(period: int) -> "SMACalculator":
+        """
+        Create a streaming SMA calculator for real-time updates.
+
+        The last ``period`` prices and their running sum are kept between
+        updates, so each update costs O(1) instead of re-summing the window.
+
+        Args:
+            period: Number of periods for SMA calculation
+
+        Returns:
+            SMACalculator instance for streaming calculations
+
+        Example:
+            >>> indicators = TechnicalIndicators()
+            >>> calculator = indicators.sma_streaming(period=2)
+            >>> calculator.update(100.0) is None
+            True
+            >>> calculator.update(102.0)
+            101.0
+        """
+        return SMACalculator(period)
 
 
 class EMACalculator:
@@ -87,7 +174,8 @@ class EMACalculator:
     Streaming EMA calculator for real-time updates.
 
     This class maintains state between updates, allowing you to calculate
-    EMA values as new prices arrive one at a time.
+    EMA values as new prices arrive one at a time. The running EMA value is
+    held by the Rust object itself, so each update only passes the new price.
 
     Example:
         >>> calculator = EMACalculator(period=5)
@@ -96,12 +184,13 @@ class EMACalculator:
         ...     print(f"Price: {price}, EMA: {ema:.2f}")
     """
 
-    def __init__(self, period: int):
+    def __init__(self, period: int, seed: Optional[float] = None):
         """
         Initialize EMA calculator.
 
         Args:
             period: Number of periods for EMA calculation (must be > 0)
+            seed: Optional starting EMA value; see ``load_state``
 
         Raises:
             ValueError: If period is invalid
@@ -109,8 +198,7 @@ class EMACalculator:
         if period <= 0:
             raise ValueError("Period must be greater than 0")
 
-        self._calculator = pyfinance.EMA(period=period)
-        self._current_ema: Optional[float] = None
+        self._calculator = pyfinance.EMA(period=period, seed=seed)
 
     def update(self, price: float) -> float:
         """
@@ -129,13 +217,12 @@ class EMACalculator:
             >>> ema3 = calculator.update(14.0)
             >>> assert ema3 > ema2 > ema1
         """
-        self._current_ema = self._calculator.update(self._current_ema, price)
-        return self._current_ema
+        return self._calculator.update(price)
 
     @property
     def current_value(self) -> Optional[float]:
         """Get the current EMA value"""
-        return self._current_ema
+        return self._calculator.current
 
     @property
     def period(self) -> int:
@@ -149,4 +236,90 @@ class EMACalculator:
 
     def reset(self) -> None:
         """Reset the calculator state"""
-        self._current_ema = None
+        self._calculator.reset()
+
+    def dump_state(self) -> Optional[float]:
+        """
+        Return the streaming state for persisting across restarts.
+
+        The state of an EMA is its current value, so restoring it with
+        ``load_state`` (or passing it as ``seed``) continues the series
+        exactly where it left off, without replaying the price history.
+
+        Returns:
+            The current EMA value, or None before the first update
+        """
+        return self._calculator.current
+
+    def load_state(self, state: Optional[float]) -> None:
+        """
+        Restore a state previously returned by ``dump_state``.
+
+        Args:
+            state: EMA value to continue from; None resets the calculator
+
+        Example:
+            >>> calculator = EMACalculator(period=3)
+            >>> calculator.load_state(11.0)
+            >>> calculator.update(13.0)
+            12.0
+        """
+        self._calculator.current = state
+
+
+class SMACalculator:
+    """
+    Streaming SMA calculator for real-time updates.
+
+    The price window lives in a ring buffer in Rust together with its running
+    sum, so each update adds the incoming price and drops the outgoing one.
+
+    Example:
+        >>> calculator = SMACalculator(period=3)
+        >>> for price in [100, 102, 101, 103, 105]:
+        ...     sma = calculator.update(price)
+        ...     if sma is not None:
+        ...         print(f"Price: {price}, SMA: {sma:.2f}")
+    """
+
+    def __init__(self, period: int):
+        """
+        Initialize SMA calculator.
+
+        Args:
+            period: Number of periods for SMA calculation (must be > 0)
+
+        Raises:
+            ValueError: If period is invalid
+        """
+        if period <= 0:
+            raise ValueError("Period must be greater than 0")
+
+        self._calculator = pyfinance.SMA(period=period)
+
+    def update(self, price: float) -> Optional[float]:
+        """
+        Update SMA with a new price.
+
+        Args:
+            price: New price value
+
+        Returns:
+            SMA of the last ``period`` prices, or None until ``period``
+            prices have been seen
+        """
+        return self._calculator.update(price)
+
+    @property
+    def current_value(self) -> Optional[float]:
+        """Get the current SMA value"""
+        return self._calculator.current
+
+    @property
+    def period(self) -> int:
+        """Get the period used for calculation"""
+        return self._calculator.period
+
+    def reset(self) -> None:
+        """Reset the calculator state"""
+        self._calculator.reset()
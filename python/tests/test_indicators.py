@@ -0,0 +1,102 @@
+"""Checks of the TechnicalIndicators service layer"""
+
+import numpy as np
+import pytest
+
+from finance_service.indicators import EMACalculator, TechnicalIndicators
+
+
+def _prices(n, seed=0):
+    return 100.0 + np.cumsum(np.random.default_rng(seed).normal(0.0, 1.0, n))
+
+
+@pytest.mark.parametrize(
+    "n, period",
+    [
+        (20, 20),  # exactly one period: the SMA seed itself
+        (25, 20),  # a few steps past the seed
+        (100_000, 50),  # long history, where early weights underflow
+    ],
+)
+def test_ema_latest_matches_ema(n, period):
+    prices = _prices(n)
+
+    latest = TechnicalIndicators.ema_latest(prices, period)
+
+    assert latest == pytest.approx(TechnicalIndicators.ema(prices, period)[-1])
+
+
+def test_ema_latest_accepts_sequences():
+    prices = [10.0, 11.0, 12.0, 13.0, 14.0]
+
+    assert TechnicalIndicators.ema_latest(prices, period=3) == pytest.approx(13.0)
+
+
+@pytest.mark.parametrize(
+    "prices, period, message",
+    [
+        ([1.0, 2.0, 3.0], 0, "Period must be greater than 0"),
+        ([1.0, 2.0, 3.0], -1, "Period must be greater than 0"),
+        ([1.0, 2.0], 3, "Need at least 3 data points, got 2"),
+        ([], 1, "Need at least 1 data points, got 0"),
+        ([[1.0, 2.0], [3.0, 4.0]], 2, "one-dimensional"),
+    ],
+)
+def test_ema_latest_invalid_input(prices, period, message):
+    with pytest.raises(ValueError, match=message):
+        TechnicalIndicators.ema_latest(prices, period)
+
+
+@pytest.mark.parametrize("restore", ["seed", "load_state"])
+def test_ema_state_round_trip(restore):
+    prices = _prices(300, seed=1)
+    split = 120
+
+    uninterrupted = EMACalculator(period=10)
+    expected = [uninterrupted.update(price) for price in prices]
+
+    before = EMACalculator(period=10)
+    for price in prices[:split]:
+        before.update(price)
+    state = before.dump_state()
+
+    if restore == "seed":
+        after = EMACalculator(period=10, seed=state)
+    else:
+        after = EMACalculator(period=10)
+        after.load_state(state)
+
+    assert after.current_value == expected[split - 1]
+    assert [after.update(price) for price in prices[split:]] == expected[split:]
+
+
+def test_ema_dump_state_before_first_update():
+    assert EMACalculator(period=5).dump_state() is None
+
+
+def test_ema_load_state_none_resets():
+    calculator = EMACalculator(period=3)
+    calculator.update(10.0)
+    calculator.update(12.0)
+
+    calculator.load_state(None)
+
+    assert calculator.dump_state() is None
+    # Without state the next price starts the EMA again
+    assert calculator.update(20.0) == 20.0
+
+
+def test_sma_long_stream_does_not_drift():
+    period = 50
+    # Prices climb from 1 to 1e6 and back, ten times over, so the running sum
+    # keeps changing magnitude and each change loses low bits
+    i = np.arange(200_000)
+    phase = (i % 20_000) / 20_000
+    prices = 1e6 ** (1.0 - np.abs(2.0 * phase - 1.0)) * (1.0 + np.sin(i) * 1e-3)
+
+    calculator = TechnicalIndicators.sma_streaming(period)
+    values = np.array([calculator.update(price) for price in prices][period - 1:])
+
+    expected = np.convolve(prices, np.ones(period) / period, mode="valid")
+    np.testing.assert_allclose(values[-1], np.mean(prices[-period:]), rtol=1e-12)
+    np.testing.assert_allclose(values, expected, rtol=1e-9)
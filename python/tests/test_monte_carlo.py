@@ -0,0 +1,102 @@
+"""Checks of OptionPricer.price_mc against the closed form and basic bounds"""
+
+import math
+
+import numpy as np
+import pytest
+
+from finance_service.pricing import OptionPricer, OptionType
+
+FIELDS = ("price", "delta", "gamma", "theta", "vega", "rho")
+
+# At-the-money contract with a dividend, so every term of the formula matters
+CONTRACT = dict(
+    spot_price=100.0,
+    strike_price=100.0,
+    time_to_expiry=1.0,
+    risk_free_rate=0.05,
+    volatility=0.2,
+    dividend_yield=0.01,
+)
+
+
+@pytest.mark.parametrize("option_type", [OptionType.CALL, OptionType.PUT])
+def test_european_matches_closed_form(option_type):
+    # Independent seeds give an estimate of the standard error of each output
+    runs = np.array([
+        [getattr(OptionPricer.price_mc(**CONTRACT, option_type=option_type,
+                                       n_paths=50_000, seed=seed), f) for f in FIELDS]
+        for seed in range(10)
+    ])
+    mean = runs.mean(axis=0)
+    std_error = runs.std(axis=0, ddof=1) / math.sqrt(len(runs))
+    exact = OptionPricer.price_option(**CONTRACT, option_type=option_type)
+
+    for field, estimate, se in zip(FIELDS, mean, std_error):
+        expected = getattr(exact, field)
+        # The slack on top of the noise covers the finite-difference bias
+        tolerance = 4.0 * se + 1e-3 * abs(expected)
+        assert abs(estimate - expected) < tolerance, (field, estimate, expected, se)
+
+
+def test_american_put_at_least_european():
+    contract = dict(CONTRACT, dividend_yield=0.0)
+    european = OptionPricer.price_option(**contract, option_type=OptionType.PUT)
+    american = OptionPricer.price_mc(
+        **contract, option_type=OptionType.PUT, n_paths=20_000, exercise="american", seed=7
+    )
+    assert american.price >= european.price
+
+    # Deep in the money, immediate exercise bounds the price from below
+    deep = OptionPricer.price_mc(
+        **dict(contract, spot_price=60.0), option_type=OptionType.PUT,
+        n_paths=20_000, exercise="american", seed=7,
+    )
+    assert deep.price >= 40.0
+
+
+@pytest.mark.parametrize("exercise", ["european", "american"])
+def test_seed_reproducible(exercise):
+    def run(seed):
+        return OptionPricer.price_mc(
+            **CONTRACT, option_type=OptionType.PUT, n_paths=2_000, n_steps=10,
+            exercise=exercise, seed=seed,
+        )
+
+    assert run(3) == run(3)
+    assert run(3) != run(4)
+
+
+@pytest.mark.parametrize("n_paths", [3, 10_001])
+def test_odd_n_paths(n_paths):
+    result = OptionPricer.price_mc(**CONTRACT, option_type=OptionType.CALL,
+                                   n_paths=n_paths, seed=1)
+    assert all(math.isfinite(getattr(result, f)) for f in FIELDS)
+
+
+def test_numpy_integer_counts_accepted():
+    result = OptionPricer.price_mc(**CONTRACT, option_type=OptionType.CALL,
+                                   n_paths=np.int64(1_000), n_steps=np.int32(5), seed=1)
+    assert result.price > 0
+
+
+@pytest.mark.parametrize("counts", [
+    dict(n_paths=1e6),
+    dict(n_paths=True),
+    dict(n_steps=2.5, exercise="american"),
+])
+def test_non_integer_counts_rejected(counts):
+    with pytest.raises(TypeError, match="must be an integer"):
+        OptionPricer.price_mc(**CONTRACT, option_type=OptionType.CALL, **counts)
+
+
+def test_cuda_matches_closed_form():
+    cuda = pytest.importorskip("numba.cuda")
+    if not cuda.is_available():
+        pytest.skip("no CUDA device (set NUMBA_ENABLE_CUDASIM=1 to use the simulator)")
+
+    result = OptionPricer.price_mc(**CONTRACT, option_type=OptionType.CALL,
+                                   n_paths=20_000, device="cuda", seed=5)
+    exact = OptionPricer.price_option(**CONTRACT, option_type=OptionType.CALL)
+    # Standard error of the price is about 0.07 at this path count
+    assert abs(result.price - exact.price) < 0.3
@@ -0,0 +1,173 @@
+"""Checks of the Numba fallback modules, imported directly
+
+The service layer only uses these modules when the Rust extension is missing,
+so they are tested here on their own, and against the extension when it is
+installed.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+pytest.importorskip("numba")
+
+from finance_service import _indicators_numba, _pricing_numba  # noqa: E402
+
+FIELDS = ("price", "delta", "gamma", "theta", "vega", "rho")
+
+CONTRACT = dict(
+    spot_price=100.0,
+    strike_price=100.0,
+    time_to_expiry=1.0,
+    risk_free_rate=0.05,
+    volatility=0.2,
+    dividend_yield=0.0,
+)
+
+
+def _batch_arrays(n=257):
+    rng = np.random.default_rng(0)
+    return dict(
+        spot_prices=rng.uniform(50.0, 150.0, n),
+        strike_prices=rng.uniform(50.0, 150.0, n),
+        times_to_expiry=np.where(np.arange(n) % 50 == 0, 0.0, rng.uniform(0.01, 3.0, n)),
+        risk_free_rates=rng.uniform(0.0, 0.08, n),
+        volatilities=rng.uniform(0.05, 0.9, n),
+        dividend_yields=rng.uniform(0.0, 0.04, n),
+        is_call=rng.random(n) < 0.5,
+    )
+
+
+def _prices(n=500):
+    return 100.0 + np.cumsum(np.random.default_rng(1).normal(0.0, 1.0, n))
+
+
+def test_ema_warmup_and_values():
+    ema = _indicators_numba.EMA(period=3)
+    result = ema.calculate([10.0, 11.0, 12.0, 13.0, 14.0])
+
+    assert np.isnan(result[:2]).all()
+    # The first value is the SMA of the first period, then alpha = 0.5
+    np.testing.assert_array_equal(result[2:], [11.0, 12.0, 13.0])
+
+
+def test_ema_insufficient_data():
+    with pytest.raises(ValueError, match="Insufficient data"):
+        _indicators_numba.EMA(period=5).calculate([1.0, 2.0])
+
+
+def test_ema_update_matches_calculate():
+    prices = _prices()
+    period = 10
+    batch = _indicators_numba.EMA(period=period).calculate_np(prices)
+
+    stream = _indicators_numba.EMA(period=period, seed=batch[period - 1])
+    for price, expected in zip(prices[period:], batch[period:]):
+        assert stream.update(price) == pytest.approx(expected, rel=1e-12)
+
+
+def test_sma_warmup_and_values():
+    sma = _indicators_numba.SMA(period=3)
+
+    assert sma.update(10.0) is None
+    assert sma.update(11.0) is None
+    assert sma.update(12.0) == 11.0
+    assert sma.update(16.0) == 13.0
+
+
+def test_black_scholes_known_values():
+    call = _pricing_numba.price_option(**CONTRACT, option_type="call")
+    put = _pricing_numba.price_option(**CONTRACT, option_type="put")
+
+    # Reference values from the exact normal CDF; the approximation is within 1e-5
+    assert call.price == pytest.approx(10.450584, abs=1e-4)
+    assert put.price == pytest.approx(5.573526, abs=1e-4)
+    assert call.delta == pytest.approx(0.636831, abs=1e-5)
+    assert put.delta == pytest.approx(-0.363169, abs=1e-5)
+
+
+def test_put_call_parity():
+    arrays = _batch_arrays()
+    calls = _pricing_numba.price_options_batch(**{**arrays, "is_call": np.ones(257, dtype=bool)})
+    puts = _pricing_numba.price_options_batch(**{**arrays, "is_call": np.zeros(257, dtype=bool)})
+
+    # C - P = S e^(-qT) - K e^(-rT)
+    t = arrays["times_to_expiry"]
+    forward = arrays["spot_prices"] * np.exp(-arrays["dividend_yields"] * t)
+    strike = arrays["strike_prices"] * np.exp(-arrays["risk_free_rates"] * t)
+    np.testing.assert_allclose(calls["price"] - puts["price"], forward - strike, atol=1e-10)
+
+
+def test_expired_contract_is_intrinsic():
+    result = _pricing_numba.price_option(
+        **{**CONTRACT, "spot_price": 110.0, "time_to_expiry": 0.0}, option_type="call"
+    )
+
+    assert result.price == 10.0
+    assert result.delta == 1.0
+    assert result.gamma == result.theta == result.vega == result.rho == 0.0
+
+
+def test_scalar_entry_points_match_batch():
+    arrays = _batch_arrays(n=8)
+    batch = _pricing_numba.price_options_batch(**arrays)
+
+    for i in range(8):
+        args = [arrays[name][i] for name in arrays]
+        positional = _pricing_numba.price_option_pos(*args)
+        keyword = _pricing_numba.price_option(
+            arrays["spot_prices"][i],
+            arrays["strike_prices"][i],
+            arrays["times_to_expiry"][i],
+            arrays["risk_free_rates"][i],
+            arrays["volatilities"][i],
+            arrays["dividend_yields"][i],
+            "call" if arrays["is_call"][i] else "put",
+        )
+        for field in FIELDS:
+            assert getattr(positional, field) == batch[field][i]
+            assert getattr(keyword, field) == batch[field][i]
+
+
+def test_pricing_matches_rust_extension():
+    pyfinance = pytest.importorskip("pyfinance")
+    arrays = _batch_arrays()
+
+    expected = pyfinance.price_options_batch(**arrays)
+    actual = _pricing_numba.price_options_batch(**arrays)
+
+    for field in FIELDS:
+        np.testing.assert_allclose(actual[field], expected[field], rtol=1e-9, atol=1e-9)
+
+    expected_ladder = pyfinance.price_strike_ladder(
+        100.0, arrays["strike_prices"], 0.5, 0.03, 0.25, 0.01, False
+    )
+    actual_ladder = _pricing_numba.price_strike_ladder(
+        100.0, arrays["strike_prices"], 0.5, 0.03, 0.25, 0.01, False
+    )
+    for field in FIELDS:
+        np.testing.assert_allclose(
+            actual_ladder[field], expected_ladder[field], rtol=1e-9, atol=1e-9
+        )
+
+
+def test_indicators_match_rust_extension():
+    pyfinance = pytest.importorskip("pyfinance")
+    prices = _prices()
+
+    np.testing.assert_allclose(
+        _indicators_numba.EMA(period=20).calculate_np(prices),
+        pyfinance.EMA(period=20).calculate_np(prices),
+        rtol=1e-12,
+    )
+
+    rust_sma = pyfinance.SMA(period=20)
+    numba_sma = _indicators_numba.SMA(period=20)
+    for price in prices:
+        expected = rust_sma.update(price)
+        actual = numba_sma.update(price)
+        if expected is None:
+            assert actual is None
+        else:
+            assert math.isclose(actual, expected, rel_tol=1e-12)
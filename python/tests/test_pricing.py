@@ -0,0 +1,114 @@
+"""Checks of PricingResultArray indexing, conversion and comparison"""
+
+import numpy as np
+import pytest
+
+from finance_service.pricing import OptionPricer, OptionType, PricingResult, PricingResultArray
+
+FIELDS = ("price", "delta", "gamma", "theta", "vega", "rho")
+
+
+@pytest.fixture
+def result():
+    # Column j of field i holds 10 * i + j, so every entry is distinct
+    return PricingResultArray(
+        **{field: np.arange(5, dtype=np.float64) + 10.0 * i for i, field in enumerate(FIELDS)}
+    )
+
+
+def _assert_rows(selected, result, rows):
+    assert isinstance(selected, PricingResultArray)
+    for field in FIELDS:
+        np.testing.assert_array_equal(getattr(selected, field), getattr(result, field)[rows])
+
+
+@pytest.mark.parametrize("index", [2, -1, np.int64(3)])
+def test_integer_index_returns_contract(result, index):
+    contract = result[index]
+
+    assert isinstance(contract, PricingResult)
+    for field in FIELDS:
+        value = getattr(contract, field)
+        assert type(value) is float
+        assert value == getattr(result, field)[index]
+
+
+def test_integer_index_out_of_range(result):
+    with pytest.raises(IndexError):
+        result[5]
+
+
+def test_slice(result):
+    _assert_rows(result[1:4], result, slice(1, 4))
+    _assert_rows(result[::-2], result, slice(None, None, -2))
+
+
+def test_boolean_mask(result):
+    mask = result.price > 1.5
+    selected = result[mask]
+
+    _assert_rows(selected, result, mask)
+    assert len(selected) == 3
+
+
+@pytest.mark.parametrize("rows", [[4, 0, 0], np.array([1, 3])])
+def test_fancy_index(result, rows):
+    _assert_rows(result[rows], result, rows)
+
+
+@pytest.mark.parametrize("index", [1.0, "price", (0, 1), None])
+def test_invalid_index_raises_type_error(result, index):
+    with pytest.raises(TypeError, match="PricingResultArray indices"):
+        result[index]
+
+
+def test_equality_is_identity(result):
+    copy = PricingResultArray(**result.to_dict())
+
+    # Comparing array fields element-wise would raise on truth testing
+    assert result == result
+    assert result != copy
+    assert result in [result]
+
+
+def test_to_dict(result):
+    columns = result.to_dict()
+
+    assert list(columns) == list(FIELDS)
+    for field in FIELDS:
+        assert columns[field] is getattr(result, field)
+
+
+def test_to_dataframe(result):
+    pandas = pytest.importorskip("pandas")
+    frame = result.to_dataframe()
+
+    assert isinstance(frame, pandas.DataFrame)
+    assert list(frame.columns) == list(FIELDS)
+    assert len(frame) == len(result)
+    for field in FIELDS:
+        np.testing.assert_array_equal(frame[field].to_numpy(), getattr(result, field))
+
+
+def test_batch_rows_match_single_pricing():
+    strikes = [90.0, 100.0, 110.0]
+    batch = OptionPricer.price_options_batch(
+        spot_prices=100.0,
+        strike_prices=strikes,
+        times_to_expiry=0.5,
+        risk_free_rates=0.05,
+        volatilities=0.2,
+        option_types=OptionType.PUT,
+    )
+
+    for i, strike in enumerate(strikes):
+        single = OptionPricer.price_option(
+            spot_price=100.0,
+            strike_price=strike,
+            time_to_expiry=0.5,
+            risk_free_rate=0.05,
+            volatility=0.2,
+            option_type=OptionType.PUT,
+        )
+        for field in FIELDS:
+            assert getattr(batch[i], field) == pytest.approx(getattr(single, field), abs=1e-9)
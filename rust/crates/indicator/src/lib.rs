@@ -1,7 +1,8 @@
 //! Technical analysis indicators library
 //!
 //! This library provides implementations of common technical analysis indicators
-//! for financial markets, starting with the Exponential Moving Average (EMA).
+//! for financial markets: the Exponential Moving Average (EMA) and a streaming
+//! Simple Moving Average (SMA).
 //!
 //! # Example
 //!
@@ -19,6 +20,9 @@
 //! # Ok::<(), indicator::IndicatorError>(())
 //! ```
 
+use std::collections::VecDeque;
+use std::sync::OnceLock;
+
 use thiserror::Error;
 
 /// Errors that can occur during indicator calculations
@@ -64,6 +68,8 @@ pub struct EMA {
     period: usize,
     /// Smoothing factor (alpha)
     alpha: f64,
+    /// Weight of the previous EMA value (1 - alpha)
+    one_minus_alpha: f64,
 }
 
 impl EMA {
@@ -95,7 +101,38 @@ impl EMA {
         // Calculate smoothing factor: α = 2 / (period + 1)
         let alpha = 2.0 / (period as f64 + 1.0);
 
-        Ok(Self { period, alpha })
+        Ok(Self {
+            period,
+            alpha,
+            one_minus_alpha: 1.0 - alpha,
+        })
+    }
+
+    /// Applies one step of the EMA recurrence
+    ///
+    /// Each step depends on the previous one, so the recurrence cannot be
+    /// vectorized across time; what matters is the latency of this chain.
+    /// With FMA available the previous value goes through a single fused
+    /// multiply-add instead of a multiply followed by an add.
+    #[inline(always)]
+    fn step(&self, prev_ema: f64, price: f64) -> f64 {
+        #[cfg(any(target_feature = "fma", target_arch = "aarch64"))]
+        {
+            self.fused_step(prev_ema, price)
+        }
+        // Without hardware FMA, `mul_add` would be a libm call
+        #[cfg(not(any(target_feature = "fma", target_arch = "aarch64")))]
+        {
+            self.alpha * price + self.one_minus_alpha * prev_ema
+        }
+    }
+
+    /// Applies one step of the EMA recurrence with a fused multiply-add
+    ///
+    /// Only call this where hardware FMA is known to be available.
+    #[inline(always)]
+    fn fused_step(&self, prev_ema: f64, price: f64) -> f64 {
+        prev_ema.mul_add(self.one_minus_alpha, self.alpha * price)
     }
 
     /// Calculates EMA for a batch of price data
@@ -125,6 +162,50 @@ impl EMA {
     /// # Ok::<(), indicator::IndicatorError>(())
     /// ```
     pub fn calculate(&self, prices: &[f64]) -> Result<Vec<Option<f64>>, IndicatorError> {
+        let mut values = vec![0.0; prices.len()];
+        self.calculate_into(prices, &mut values)?;
+
+        // Replace the NaN warmup values with None
+        let result = values
+            .into_iter()
+            .enumerate()
+            .map(|(i, value)| (i + 1 >= self.period).then_some(value))
+            .collect();
+
+        Ok(result)
+    }
+
+    /// Calculates EMA for a batch of price data into a caller-provided buffer
+    ///
+    /// Produces the same values as [`EMA::calculate`], but writes plain `f64`s
+    /// into `out` and marks the first `period - 1` warmup entries with `NaN`
+    /// instead of `None`. This lets callers write straight into a contiguous
+    /// array (for example a NumPy buffer) without any per-element allocation.
+    ///
+    /// # Arguments
+    ///
+    /// * `prices` - Slice of price data (must have at least `period` values)
+    /// * `out` - Output buffer with the same length as `prices`
+    ///
+    /// # Returns
+    ///
+    /// Returns an error if there is insufficient data or `out` has the wrong length.
+    ///
+    /// # Example
+    ///
+    /// ```
+    /// use indicator::EMA;
+    ///
+    /// let ema = EMA::new(3)?;
+    /// let prices = [10.0, 11.0, 12.0, 13.0, 14.0];
+    /// let mut out = [0.0; 5];
+    /// ema.calculate_into(&prices, &mut out)?;
+    ///
+    /// assert!(out[1].is_nan());
+    /// assert_eq!(out[2], 11.0);
+    /// # Ok::<(), indicator::IndicatorError>(())
+    /// ```
+    pub fn calculate_into(&self, prices: &[f64], out: &mut [f64]) -> Result<(), IndicatorError> {
         if prices.is_empty() {
             return Err(IndicatorError::InsufficientData(
                 "Price data cannot be empty".to_string(),
@@ -137,31 +218,32 @@ impl EMA {
             ));
         }
 
-        let mut result = Vec::with_capacity(prices.len());
-
-        // Fill first period-1 values with None
-        for _ in 0..self.period - 1 {
-            result.push(None);
+        if out.len() != prices.len() {
+            return Err(IndicatorError::InvalidParameter(format!(
+                "Output length {} does not match input length {}",
+                out.len(),
+                prices.len()
+            )));
         }
 
+        let (warmup, values) = out.split_at_mut(self.period - 1);
+        warmup.fill(f64::NAN);
+
         // Calculate initial SMA for the first EMA value
-        let initial_sma: f64 = prices[..self.period].iter().sum::<f64>() / self.period as f64;
-        result.push(Some(initial_sma));
+        let initial_sma = prices[..self.period].iter().sum::<f64>() / self.period as f64;
+        values[0] = initial_sma;
 
         // Calculate subsequent EMA values
-        let mut prev_ema = initial_sma;
-        for &price in &prices[self.period..] {
-            let ema = self.alpha * price + (1.0 - self.alpha) * prev_ema;
-            result.push(Some(ema));
-            prev_ema = ema;
-        }
+        smooth_kernel()(self, initial_sma, &prices[self.period..], &mut values[1..]);
 
-        Ok(result)
+        Ok(())
     }
 
     /// Updates EMA with a new price value (streaming mode)
     ///
     /// This is useful for real-time calculations where prices arrive one at a time.
+    /// It runs the same recurrence kernel as [`EMA::calculate`], so streaming a
+    /// series reproduces the batch values exactly.
     ///
     /// # Arguments
     ///
@@ -188,7 +270,11 @@ impl EMA {
     /// ```
     pub fn update(&self, current_ema: Option<f64>, new_price: f64) -> f64 {
         match current_ema {
-            Some(ema) => self.alpha * new_price + (1.0 - self.alpha) * ema,
+            Some(ema) => {
+                let mut next = [0.0];
+                smooth_kernel()(self, ema, &[new_price], &mut next);
+                next[0]
+            }
             None => new_price, // If no previous EMA, use the price itself
         }
     }
@@ -204,6 +290,162 @@ impl EMA {
     }
 }
 
+/// Batch EMA recurrence: starting from `initial`, writes the EMA after each
+/// price in `prices` to the matching slot of `out`
+type SmoothFn = fn(&EMA, f64, &[f64], &mut [f64]);
+
+/// Returns the batch recurrence for the running CPU, detecting it on first use
+///
+/// The baseline x86-64 target has no FMA, so a variant compiled with FMA enabled
+/// is selected when the CPU supports it. Other targets use the generic variant.
+fn smooth_kernel() -> SmoothFn {
+    static KERNEL: OnceLock<SmoothFn> = OnceLock::new();
+    *KERNEL.get_or_init(|| {
+        #[cfg(target_arch = "x86_64")]
+        if std::arch::is_x86_feature_detected!("fma") {
+            return smooth_fma;
+        }
+        smooth::<false>
+    })
+}
+
+/// Body of the batch recurrence, using [`EMA::fused_step`] if `FUSED` is set
+#[inline(always)]
+fn smooth<const FUSED: bool>(ema: &EMA, initial: f64, prices: &[f64], out: &mut [f64]) {
+    let mut prev_ema = initial;
+    for (slot, &price) in out.iter_mut().zip(prices) {
+        prev_ema = if FUSED {
+            ema.fused_step(prev_ema, price)
+        } else {
+            ema.step(prev_ema, price)
+        };
+        *slot = prev_ema;
+    }
+}
+
+/// Batch recurrence compiled with FMA enabled
+#[cfg(target_arch = "x86_64")]
+fn smooth_fma(ema: &EMA, initial: f64, prices: &[f64], out: &mut [f64]) {
+    #[target_feature(enable = "fma")]
+    unsafe fn fused(ema: &EMA, initial: f64, prices: &[f64], out: &mut [f64]) {
+        smooth::<true>(ema, initial, prices, out);
+    }
+
+    // SAFETY: only selected by `smooth_kernel` after FMA was detected
+    unsafe { fused(ema, initial, prices, out) }
+}
+
+/// Simple Moving Average (SMA) indicator for streaming data
+///
+/// Keeps the last `period` prices in a ring buffer together with their running
+/// sum, so each update adds the incoming price and subtracts the outgoing one
+/// instead of summing the whole window again. The sum is compensated with
+/// Neumaier's method, so rounding errors do not build up on long streams.
+///
+/// # Example
+///
+/// ```
+/// use indicator::SMA;
+///
+/// let mut sma = SMA::new(3)?;
+/// assert_eq!(sma.update(10.0), None);
+/// assert_eq!(sma.update(11.0), None);
+/// assert_eq!(sma.update(12.0), Some(11.0));
+/// assert_eq!(sma.update(16.0), Some(13.0));
+/// # Ok::<(), indicator::IndicatorError>(())
+/// ```
+#[derive(Debug, Clone, PartialEq)]
+pub struct SMA {
+    /// Period for the SMA calculation
+    period: usize,
+    /// Last `period` prices, oldest first
+    window: VecDeque<f64>,
+    /// Running sum of the prices in `window`, before compensation
+    sum: f64,
+    /// Rounding error lost from `sum`, to be added back when reading it
+    compensation: f64,
+}
+
+impl SMA {
+    /// Creates a new SMA indicator with the specified period
+    ///
+    /// # Arguments
+    ///
+    /// * `period` - Number of periods for the SMA calculation (must be > 0)
+    ///
+    /// # Returns
+    ///
+    /// Returns a configured `SMA` instance or an error if the period is invalid.
+    pub fn new(period: usize) -> Result<Self, IndicatorError> {
+        if period == 0 {
+            return Err(IndicatorError::InvalidParameter(
+                "Period must be greater than 0".to_string(),
+            ));
+        }
+
+        Ok(Self {
+            period,
+            window: VecDeque::with_capacity(period),
+            sum: 0.0,
+            compensation: 0.0,
+        })
+    }
+
+    /// Updates SMA with a new price value (streaming mode)
+    ///
+    /// Runs in O(1) regardless of the period.
+    ///
+    /// # Arguments
+    ///
+    /// * `new_price` - The new price to incorporate
+    ///
+    /// # Returns
+    ///
+    /// Returns the SMA of the last `period` prices, or `None` until `period`
+    /// prices have been seen.
+    pub fn update(&mut self, new_price: f64) -> Option<f64> {
+        if self.window.len() == self.period {
+            if let Some(oldest) = self.window.pop_front() {
+                self.accumulate(-oldest);
+            }
+        }
+        self.window.push_back(new_price);
+        self.accumulate(new_price);
+
+        self.current()
+    }
+
+    /// Adds `value` to the running sum, keeping the rounding error in
+    /// `compensation` (Neumaier's variant of Kahan summation)
+    fn accumulate(&mut self, value: f64) {
+        let sum = self.sum + value;
+        self.compensation += if self.sum.abs() >= value.abs() {
+            (self.sum - sum) + value
+        } else {
+            (value - sum) + self.sum
+        };
+        self.sum = sum;
+    }
+
+    /// Returns the current SMA value, or `None` until `period` prices have been seen
+    pub fn current(&self) -> Option<f64> {
+        (self.window.len() == self.period)
+            .then(|| (self.sum + self.compensation) / self.period as f64)
+    }
+
+    /// Clears the window so the next update starts a new SMA
+    pub fn reset(&mut self) {
+        self.window.clear();
+        self.sum = 0.0;
+        self.compensation = 0.0;
+    }
+
+    /// Returns the period used for SMA calculation
+    pub fn period(&self) -> usize {
+        self.period
+    }
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -259,6 +501,63 @@ mod tests {
         assert!(result.is_err());
     }
 
+    #[test]
+    fn test_ema_calculate_into_matches_calculate() {
+        let ema = EMA::new(4).unwrap();
+        let prices = vec![10.0, 12.0, 11.0, 13.0, 15.0, 14.0, 16.0];
+        let expected = ema.calculate(&prices).unwrap();
+
+        let mut out = vec![0.0; prices.len()];
+        ema.calculate_into(&prices, &mut out).unwrap();
+
+        for (value, expected) in out.iter().zip(&expected) {
+            match expected {
+                Some(v) => assert_eq!(value, v),
+                None => assert!(value.is_nan()),
+            }
+        }
+    }
+
+    #[test]
+    fn test_ema_calculate_into_length_mismatch() {
+        let ema = EMA::new(2).unwrap();
+        let mut out = vec![0.0; 2];
+        let result = ema.calculate_into(&[10.0, 11.0, 12.0], &mut out);
+
+        assert!(matches!(result, Err(IndicatorError::InvalidParameter(_))));
+    }
+
+    #[test]
+    fn test_ema_dispatched_kernel_matches_generic() {
+        let ema = EMA::new(7).unwrap();
+        let prices: Vec<f64> = (0..100).map(|i| 100.0 + (i as f64 * 0.37).sin()).collect();
+
+        let mut dispatched = vec![0.0; prices.len()];
+        let mut generic = vec![0.0; prices.len()];
+        smooth_kernel()(&ema, 100.0, &prices, &mut dispatched);
+        smooth::<false>(&ema, 100.0, &prices, &mut generic);
+
+        for (a, b) in dispatched.iter().zip(&generic) {
+            assert!((a - b).abs() < 1e-10);
+        }
+    }
+
+    #[test]
+    fn test_ema_update_matches_calculate_into() {
+        let ema = EMA::new(7).unwrap();
+        let prices: Vec<f64> = (0..200).map(|i| 100.0 + (i as f64 * 0.37).sin()).collect();
+
+        let mut batch = vec![0.0; prices.len()];
+        ema.calculate_into(&prices, &mut batch).unwrap();
+
+        // Seed the stream with the initial SMA, as the batch path does
+        let mut current = batch[ema.period() - 1];
+        for (price, expected) in prices.iter().zip(&batch).skip(ema.period()) {
+            current = ema.update(Some(current), *price);
+            assert_eq!(current.to_bits(), expected.to_bits());
+        }
+    }
+
     #[test]
     fn test_ema_update_streaming() {
         let ema = EMA::new(3).unwrap();
@@ -304,4 +603,75 @@ mod tests {
         // And should start decreasing after the spike
         assert!(ema_values[3] < ema_values[2]);
     }
+
+    #[test]
+    fn test_sma_invalid_period() {
+        assert!(SMA::new(0).is_err());
+    }
+
+    #[test]
+    fn test_sma_update_streaming() {
+        let mut sma = SMA::new(3).unwrap();
+
+        assert_eq!(sma.update(10.0), None);
+        assert_eq!(sma.update(11.0), None);
+        assert_eq!(sma.current(), None);
+        assert_eq!(sma.update(12.0), Some(11.0));
+        assert_eq!(sma.update(13.0), Some(12.0));
+        assert_eq!(sma.update(20.0), Some(15.0));
+        assert_eq!(sma.current(), Some(15.0));
+
+        sma.reset();
+        assert_eq!(sma.current(), None);
+        assert_eq!(sma.update(10.0), None);
+    }
+
+    #[test]
+    fn test_sma_matches_window_mean() {
+        let period = 5;
+        let mut sma = SMA::new(period).unwrap();
+        let prices: Vec<f64> = (0..1000)
+            .map(|i| 1e6 + (i as f64 * 0.7).sin() * 1e3)
+            .collect();
+
+        for (i, &price) in prices.iter().enumerate() {
+            let value = sma.update(price);
+            if i + 1 < period {
+                assert_eq!(value, None);
+            } else {
+                let window = &prices[i + 1 - period..=i];
+                let expected = window.iter().sum::<f64>() / period as f64;
+                assert!((value.unwrap() - expected).abs() < 1e-6);
+            }
+        }
+    }
+
+    #[test]
+    fn test_sma_long_stream_does_not_drift() {
+        let period = 50;
+        let mut sma = SMA::new(period).unwrap();
+        let mut window = VecDeque::new();
+
+        // Prices climb from 1 to 1e6 and fall back to 1, ten times over, so the
+        // running sum keeps changing magnitude and each change loses low bits
+        for i in 0..1_000_000 {
+            let phase = (i % 100_000) as f64 / 100_000.0;
+            let price =
+                1e6_f64.powf(1.0 - (2.0 * phase - 1.0).abs()) * (1.0 + (i as f64).sin() * 1e-3);
+            if window.len() == period {
+                window.pop_front();
+            }
+            window.push_back(price);
+            sma.update(price);
+        }
+
+        let expected = window.iter().sum::<f64>() / period as f64;
+        let value = sma.current().unwrap();
+        assert!(
+            (value - expected).abs() <= 1e-12 * expected,
+            "{} != {}",
+            value,
+            expected
+        );
+    }
 }
@@ -23,9 +23,10 @@
 //! # Ok::<(), pricing::PricingError>(())
 //! ```
 
-use statrs::distribution::{ContinuousCDF, Normal};
 use thiserror::Error;
 
+mod simd;
+
 /// Errors that can occur during option pricing calculations
 #[derive(Debug, Error, Clone, PartialEq)]
 pub enum PricingError {
@@ -109,6 +110,239 @@ pub struct PricingResult {
     pub rho: f64,
 }
 
+mod sealed {
+    pub trait Sealed {}
+    impl Sealed for f32 {}
+    impl Sealed for f64 {}
+}
+
+/// Floating-point types supported by batch pricing
+///
+/// Implemented for `f64` (full precision) and `f32`, which fits twice as many
+/// contracts into each SIMD vector at roughly seven significant digits. This
+/// trait is sealed and cannot be implemented outside this crate.
+pub trait BatchFloat:
+    Copy + Default + PartialEq + Send + Sync + std::fmt::Debug + sealed::Sealed
+{
+    /// Converts the value to `f64`
+    fn to_f64(self) -> f64;
+
+    /// Converts an `f64` to this type, rounding if necessary
+    fn from_f64(value: f64) -> Self;
+
+    /// Runs the SIMD pricing kernel for this type
+    #[doc(hidden)]
+    fn price_kernel(params: &BatchParams<'_, Self>, out: simd::BatchColumns<'_, Self>);
+
+    /// Runs the SIMD strike ladder kernel for this type
+    #[doc(hidden)]
+    fn ladder_kernel(
+        ladder: &simd::LadderInvariants,
+        strikes: &[Self],
+        out: simd::BatchColumns<'_, Self>,
+    );
+}
+
+/// Parameters for pricing a batch of options, laid out as one slice per field
+///
+/// Every slice must have the same length; element `i` of each slice together
+/// describe the `i`-th contract. The element type is `f64` by default; use
+/// `f32` for higher throughput when seven significant digits are enough.
+#[derive(Debug, Clone, Copy, PartialEq)]
+pub struct BatchParams<'a, T = f64> {
+    /// Current prices of the underlying assets
+    pub spot_prices: &'a [T],
+    /// Strike prices of the options
+    pub strike_prices: &'a [T],
+    /// Times to expiry in years
+    pub times_to_expiry: &'a [T],
+    /// Risk-free interest rates (annualized)
+    pub risk_free_rates: &'a [T],
+    /// Volatilities of the underlying assets (annualized)
+    pub volatilities: &'a [T],
+    /// Dividend yields (annualized)
+    pub dividend_yields: &'a [T],
+    /// Types of the options
+    pub option_types: &'a [OptionType],
+}
+
+impl<T: BatchFloat> BatchParams<'_, T> {
+    /// Returns the number of contracts in the batch
+    pub fn len(&self) -> usize {
+        self.spot_prices.len()
+    }
+
+    /// Returns `true` if the batch contains no contracts
+    pub fn is_empty(&self) -> bool {
+        self.spot_prices.is_empty()
+    }
+
+    /// Returns the parameters of the `i`-th contract
+    fn contract(&self, i: usize) -> (OptionParams, OptionType) {
+        let params = OptionParams {
+            spot_price: self.spot_prices[i].to_f64(),
+            strike_price: self.strike_prices[i].to_f64(),
+            time_to_expiry: self.times_to_expiry[i].to_f64(),
+            risk_free_rate: self.risk_free_rates[i].to_f64(),
+            volatility: self.volatilities[i].to_f64(),
+            dividend_yield: self.dividend_yields[i].to_f64(),
+        };
+        (params, self.option_types[i])
+    }
+
+    /// Splits the batch into the contracts before and after `mid`
+    fn split_at(&self, mid: usize) -> (Self, Self) {
+        let (spot_left, spot_right) = self.spot_prices.split_at(mid);
+        let (strike_left, strike_right) = self.strike_prices.split_at(mid);
+        let (expiry_left, expiry_right) = self.times_to_expiry.split_at(mid);
+        let (rate_left, rate_right) = self.risk_free_rates.split_at(mid);
+        let (vol_left, vol_right) = self.volatilities.split_at(mid);
+        let (div_left, div_right) = self.dividend_yields.split_at(mid);
+        let (type_left, type_right) = self.option_types.split_at(mid);
+
+        let left = BatchParams {
+            spot_prices: spot_left,
+            strike_prices: strike_left,
+            times_to_expiry: expiry_left,
+            risk_free_rates: rate_left,
+            volatilities: vol_left,
+            dividend_yields: div_left,
+            option_types: type_left,
+        };
+        let right = BatchParams {
+            spot_prices: spot_right,
+            strike_prices: strike_right,
+            times_to_expiry: expiry_right,
+            risk_free_rates: rate_right,
+            volatilities: vol_right,
+            dividend_yields: div_right,
+            option_types: type_right,
+        };
+        (left, right)
+    }
+
+    /// Validates that all parameter slices have the same length
+    ///
+    /// Per-contract values are validated when each contract is priced.
+    pub fn validate(&self) -> Result<(), PricingError> {
+        let len = self.len();
+        let lengths = [
+            ("strike_prices", self.strike_prices.len()),
+            ("times_to_expiry", self.times_to_expiry.len()),
+            ("risk_free_rates", self.risk_free_rates.len()),
+            ("volatilities", self.volatilities.len()),
+            ("dividend_yields", self.dividend_yields.len()),
+            ("option_types", self.option_types.len()),
+        ];
+        for (name, field_len) in lengths {
+            if field_len != len {
+                return Err(PricingError::InvalidParameter(format!(
+                    "Length of {} ({}) does not match length of spot_prices ({})",
+                    name, field_len, len
+                )));
+            }
+        }
+        Ok(())
+    }
+}
+
+/// Result of pricing a batch of options, stored as one column per output
+#[derive(Debug, Clone, Default, PartialEq)]
+pub struct BatchPricingResult<T = f64> {
+    /// Option prices
+    pub price: Vec<T>,
+    /// Deltas
+    pub delta: Vec<T>,
+    /// Gammas
+    pub gamma: Vec<T>,
+    /// Thetas
+    pub theta: Vec<T>,
+    /// Vegas
+    pub vega: Vec<T>,
+    /// Rhos
+    pub rho: Vec<T>,
+}
+
+impl<T: BatchFloat> BatchPricingResult<T> {
+    /// Creates an empty result with room for `capacity` contracts in every column
+    pub fn with_capacity(capacity: usize) -> Self {
+        Self {
+            price: Vec::with_capacity(capacity),
+            delta: Vec::with_capacity(capacity),
+            gamma: Vec::with_capacity(capacity),
+            theta: Vec::with_capacity(capacity),
+            vega: Vec::with_capacity(capacity),
+            rho: Vec::with_capacity(capacity),
+        }
+    }
+
+    /// Creates a result with `len` contracts in every column, all set to zero
+    fn zeroed(len: usize) -> Self {
+        Self {
+            price: vec![T::default(); len],
+            delta: vec![T::default(); len],
+            gamma: vec![T::default(); len],
+            theta: vec![T::default(); len],
+            vega: vec![T::default(); len],
+            rho: vec![T::default(); len],
+        }
+    }
+
+    /// Borrows every column mutably for the pricing kernels
+    fn columns_mut(&mut self) -> simd::BatchColumns<'_, T> {
+        simd::BatchColumns {
+            price: &mut self.price,
+            delta: &mut self.delta,
+            gamma: &mut self.gamma,
+            theta: &mut self.theta,
+            vega: &mut self.vega,
+            rho: &mut self.rho,
+        }
+    }
+
+    /// Overwrites the result of the `i`-th contract
+    fn set(&mut self, i: usize, result: &PricingResult) {
+        self.price[i] = T::from_f64(result.price);
+        self.delta[i] = T::from_f64(result.delta);
+        self.gamma[i] = T::from_f64(result.gamma);
+        self.theta[i] = T::from_f64(result.theta);
+        self.vega[i] = T::from_f64(result.vega);
+        self.rho[i] = T::from_f64(result.rho);
+    }
+
+    /// Appends the result of a single contract
+    pub fn push(&mut self, result: &PricingResult) {
+        self.price.push(T::from_f64(result.price));
+        self.delta.push(T::from_f64(result.delta));
+        self.gamma.push(T::from_f64(result.gamma));
+        self.theta.push(T::from_f64(result.theta));
+        self.vega.push(T::from_f64(result.vega));
+        self.rho.push(T::from_f64(result.rho));
+    }
+
+    /// Returns the number of contracts in the result
+    pub fn len(&self) -> usize {
+        self.price.len()
+    }
+
+    /// Returns `true` if the result contains no contracts
+    pub fn is_empty(&self) -> bool {
+        self.price.is_empty()
+    }
+
+    /// Returns the result of the `i`-th contract, or `None` if out of bounds
+    pub fn get(&self, i: usize) -> Option<PricingResult> {
+        Some(PricingResult {
+            price: self.price.get(i)?.to_f64(),
+            delta: self.delta[i].to_f64(),
+            gamma: self.gamma[i].to_f64(),
+            theta: self.theta[i].to_f64(),
+            vega: self.vega[i].to_f64(),
+            rho: self.rho[i].to_f64(),
+        })
+    }
+}
+
 /// Black-Scholes option pricing model
 ///
 /// Implements the Black-Scholes-Merton formula for European options.
@@ -117,6 +351,10 @@ pub struct BlackScholes;
 impl BlackScholes {
     /// Calculates option price and Greeks using the Black-Scholes formula
     ///
+    /// The price and all five Greeks are always computed together; there are no
+    /// per-Greek entry points because they would each repeat the expensive
+    /// `d1`/`d2`, discount factor and normal CDF evaluations.
+    ///
     /// # Arguments
     ///
     /// * `params` - Option parameters including spot price, strike, time to expiry, etc.
@@ -153,53 +391,146 @@ impl BlackScholes {
             return Self::price_at_expiry(params, option_type);
         }
 
-        let normal = Normal::new(0.0, 1.0)
-            .map_err(|e| PricingError::CalculationError(format!("Failed to create normal distribution: {}", e)))?;
-
-        // Calculate d1 and d2
-        let sqrt_t = params.time_to_expiry.sqrt();
-        let d1 = (
-            (params.spot_price / params.strike_price).ln()
-                + (params.risk_free_rate - params.dividend_yield + 0.5 * params.volatility.powi(2))
-                    * params.time_to_expiry
-        ) / (params.volatility * sqrt_t);
-
-        let d2 = d1 - params.volatility * sqrt_t;
-
-        // Calculate price based on option type
-        let (price, delta) = match option_type {
-            OptionType::Call => {
-                let nd1 = normal.cdf(d1);
-                let nd2 = normal.cdf(d2);
-                let price = params.spot_price * (-params.dividend_yield * params.time_to_expiry).exp() * nd1
-                    - params.strike_price * (-params.risk_free_rate * params.time_to_expiry).exp() * nd2;
-                let delta = (-params.dividend_yield * params.time_to_expiry).exp() * nd1;
-                (price, delta)
-            }
-            OptionType::Put => {
-                let n_neg_d1 = normal.cdf(-d1);
-                let n_neg_d2 = normal.cdf(-d2);
-                let price = params.strike_price * (-params.risk_free_rate * params.time_to_expiry).exp() * n_neg_d2
-                    - params.spot_price * (-params.dividend_yield * params.time_to_expiry).exp() * n_neg_d1;
-                let delta = -(-params.dividend_yield * params.time_to_expiry).exp() * n_neg_d1;
-                (price, delta)
+        Ok(Self::compute_greeks(params, option_type))
+    }
+
+    /// Calculates prices and Greeks for a batch of options
+    ///
+    /// This computes the same quantities as calling [`BlackScholes::price`] for
+    /// every contract in the batch, but returns the results column-wise so that
+    /// callers (such as the Python bindings) can hand each column over as a
+    /// contiguous array.
+    ///
+    /// Contracts are priced several at a time with SIMD instructions, using the
+    /// same normal CDF approximation as [`BlackScholes::price`].
+    ///
+    /// Large batches are split into blocks that are priced in parallel on the
+    /// `rayon` thread pool.
+    ///
+    /// The batch may hold `f64` or `f32` values. The `f32` kernel prices twice as
+    /// many contracts per vector and is suited to chain-wide pricing where about
+    /// seven significant digits suffice; keep `f64` for work that needs full
+    /// precision, such as implied volatility refinement.
+    ///
+    /// # Arguments
+    ///
+    /// * `params` - Batch of option parameters, one slice per field
+    ///
+    /// # Returns
+    ///
+    /// Returns `BatchPricingResult` with one entry per contract, or a `PricingError`
+    /// if the slices differ in length or any contract has invalid parameters.
+    ///
+    /// # Example
+    ///
+    /// ```
+    /// use pricing::{BatchParams, BlackScholes, OptionType};
+    ///
+    /// let params = BatchParams {
+    ///     spot_prices: &[100.0, 100.0],
+    ///     strike_prices: &[95.0, 105.0],
+    ///     times_to_expiry: &[0.5, 0.5],
+    ///     risk_free_rates: &[0.03, 0.03],
+    ///     volatilities: &[0.25, 0.25],
+    ///     dividend_yields: &[0.0, 0.0],
+    ///     option_types: &[OptionType::Call, OptionType::Put],
+    /// };
+    ///
+    /// let result = BlackScholes::price_batch(&params)?;
+    /// assert_eq!(result.len(), 2);
+    /// # Ok::<(), pricing::PricingError>(())
+    /// ```
+    pub fn price_batch<T: BatchFloat>(
+        params: &BatchParams<'_, T>,
+    ) -> Result<BatchPricingResult<T>, PricingError> {
+        params.validate()?;
+        for i in 0..params.len() {
+            params.contract(i).0.validate()?;
+        }
+
+        let mut result = BatchPricingResult::zeroed(params.len());
+        simd::price_parallel(*params, result.columns_mut());
+
+        // The vectorised kernel divides by sqrt(T); expired contracts are
+        // replaced by their intrinsic value afterwards
+        let expired = T::from_f64(0.0);
+        for (i, _) in params
+            .times_to_expiry
+            .iter()
+            .enumerate()
+            .filter(|(_, &t)| t == expired)
+        {
+            let (contract, option_type) = params.contract(i);
+            result.set(i, &Self::price_at_expiry(&contract, option_type)?);
+        }
+
+        Ok(result)
+    }
+
+    /// Calculates prices and Greeks for one option per strike on a common expiry
+    ///
+    /// An option chain usually shares the spot price, time to expiry, rate,
+    /// volatility and dividend yield across all strikes. This computes the
+    /// strike-independent terms (`sqrt(T)`, `σ√T`, both discount factors, the
+    /// drift and `ln(S)`) once and then prices the strikes with the SIMD kernel,
+    /// where only `ln(K)` and the normal density and CDF terms remain per strike.
+    ///
+    /// Accuracy matches [`BlackScholes::price_batch`].
+    ///
+    /// # Arguments
+    ///
+    /// * `params` - Common option parameters; `strike_price` is ignored
+    /// * `strikes` - Strike prices to price
+    /// * `option_type` - Type of every option in the ladder
+    ///
+    /// # Returns
+    ///
+    /// Returns `BatchPricingResult` with one entry per strike, or a `PricingError`
+    /// if any parameter is invalid.
+    ///
+    /// # Example
+    ///
+    /// ```
+    /// use pricing::{BlackScholes, OptionParams, OptionType};
+    ///
+    /// let params = OptionParams {
+    ///     spot_price: 100.0,
+    ///     strike_price: 0.0, // ignored
+    ///     time_to_expiry: 0.5,
+    ///     risk_free_rate: 0.05,
+    ///     volatility: 0.2,
+    ///     dividend_yield: 0.0,
+    /// };
+    ///
+    /// let result = BlackScholes::price_ladder(&params, &[90.0, 100.0, 110.0], OptionType::Call)?;
+    /// assert!(result.price[0] > result.price[1]);
+    /// # Ok::<(), pricing::PricingError>(())
+    /// ```
+    pub fn price_ladder<T: BatchFloat>(
+        params: &OptionParams,
+        strikes: &[T],
+        option_type: OptionType,
+    ) -> Result<BatchPricingResult<T>, PricingError> {
+        let mut contract = params.clone();
+        for &strike in strikes {
+            contract.strike_price = strike.to_f64();
+            contract.validate()?;
+        }
+
+        let mut result = BatchPricingResult::zeroed(strikes.len());
+
+        if params.time_to_expiry == 0.0 {
+            for (i, &strike) in strikes.iter().enumerate() {
+                contract.strike_price = strike.to_f64();
+                result.set(i, &Self::price_at_expiry(&contract, option_type)?);
             }
-        };
+            return Ok(result);
+        }
 
-        // Calculate Greeks
-        let gamma = Self::calculate_gamma(params, d1, &normal);
-        let theta = Self::calculate_theta(params, d1, d2, option_type, &normal);
-        let vega = Self::calculate_vega(params, d1, &normal);
-        let rho = Self::calculate_rho(params, d2, option_type, &normal);
+        let ladder = simd::LadderInvariants::new(params, option_type);
+        T::ladder_kernel(&ladder, strikes, result.columns_mut());
 
-        Ok(PricingResult {
-            price,
-            delta,
-            gamma,
-            theta,
-            vega,
-            rho,
-        })
+        Ok(result)
     }
 
     /// Calculates option price at expiry (intrinsic value)
@@ -226,75 +557,58 @@ impl BlackScholes {
         })
     }
 
-    fn calculate_gamma(params: &OptionParams, d1: f64, _normal: &Normal) -> f64 {
-        let pdf_d1 = (-0.5 * d1.powi(2)).exp() / (2.0 * std::f64::consts::PI).sqrt();
-        let sqrt_t = params.time_to_expiry.sqrt();
-
-        (-params.dividend_yield * params.time_to_expiry).exp() * pdf_d1
-            / (params.spot_price * params.volatility * sqrt_t)
-    }
-
-    fn calculate_theta(
-        params: &OptionParams,
-        d1: f64,
-        d2: f64,
-        option_type: OptionType,
-        normal: &Normal,
-    ) -> f64 {
-        let pdf_d1 = (-0.5 * d1.powi(2)).exp() / (2.0 * std::f64::consts::PI).sqrt();
-        let sqrt_t = params.time_to_expiry.sqrt();
-
-        let term1 = -params.spot_price * pdf_d1 * params.volatility
-            * (-params.dividend_yield * params.time_to_expiry).exp()
-            / (2.0 * sqrt_t);
-
-        match option_type {
-            OptionType::Call => {
-                let term2 = params.dividend_yield * params.spot_price
-                    * normal.cdf(d1)
-                    * (-params.dividend_yield * params.time_to_expiry).exp();
-                let term3 = params.risk_free_rate * params.strike_price
-                    * (-params.risk_free_rate * params.time_to_expiry).exp()
-                    * normal.cdf(d2);
-                term1 + term2 - term3
-            }
-            OptionType::Put => {
-                let term2 = params.dividend_yield * params.spot_price
-                    * normal.cdf(-d1)
-                    * (-params.dividend_yield * params.time_to_expiry).exp();
-                let term3 = params.risk_free_rate * params.strike_price
-                    * (-params.risk_free_rate * params.time_to_expiry).exp()
-                    * normal.cdf(-d2);
-                term1 - term2 + term3
-            }
-        }
-    }
-
-    fn calculate_vega(params: &OptionParams, d1: f64, _normal: &Normal) -> f64 {
-        let pdf_d1 = (-0.5 * d1.powi(2)).exp() / (2.0 * std::f64::consts::PI).sqrt();
-        let sqrt_t = params.time_to_expiry.sqrt();
-
-        params.spot_price * (-params.dividend_yield * params.time_to_expiry).exp()
-            * pdf_d1 * sqrt_t / 100.0  // Divide by 100 to express per 1% change
-    }
-
-    fn calculate_rho(
-        params: &OptionParams,
-        d2: f64,
-        option_type: OptionType,
-        normal: &Normal,
-    ) -> f64 {
-        match option_type {
-            OptionType::Call => {
-                params.strike_price * params.time_to_expiry
-                    * (-params.risk_free_rate * params.time_to_expiry).exp()
-                    * normal.cdf(d2) / 100.0  // Divide by 100 to express per 1% change
-            }
-            OptionType::Put => {
-                -params.strike_price * params.time_to_expiry
-                    * (-params.risk_free_rate * params.time_to_expiry).exp()
-                    * normal.cdf(-d2) / 100.0
-            }
+    /// Computes price and all Greeks from a single set of intermediate values
+    ///
+    /// `d1`, `d2`, the two discount factors, `N(±d1)`, `N(±d2)` and the density
+    /// `n(d1)` are each evaluated exactly once and shared by every output, so
+    /// pricing with all Greeks costs little more than pricing alone. The put
+    /// formulas are expressed through the call ones with `sign = -1` and
+    /// `N(-d)` in place of `N(d)`.
+    ///
+    /// `N(x)` is evaluated with the branchless Abramowitz-Stegun 26.2.17
+    /// polynomial (absolute error below 7.5e-8) shared with the batch kernels,
+    /// which is several times cheaper than an `erfc`-based CDF.
+    ///
+    /// Requires `time_to_expiry > 0`.
+    fn compute_greeks(params: &OptionParams, option_type: OptionType) -> PricingResult {
+        let s = params.spot_price;
+        let k = params.strike_price;
+        let t = params.time_to_expiry;
+        let r = params.risk_free_rate;
+        let q = params.dividend_yield;
+        let sigma = params.volatility;
+
+        let sqrt_t = t.sqrt();
+        let sigma_sqrt_t = sigma * sqrt_t;
+        let d1 = ((s / k).ln() + (r - q + 0.5 * sigma * sigma) * t) / sigma_sqrt_t;
+        let d2 = d1 - sigma_sqrt_t;
+
+        let disc_r = (-r * t).exp();
+        let disc_q = (-q * t).exp();
+        let pdf_d1 = simd::norm_pdf(d1);
+        // n(d2) = n(d1) S e^(-qT) / (K e^(-rT)), which saves an `exp`
+        let pdf_d2 = pdf_d1 * (s * disc_q) / (k * disc_r);
+
+        // n(-x) = n(x), so the same densities serve N(-d1) and N(-d2) for puts
+        let sign = match option_type {
+            OptionType::Call => 1.0,
+            OptionType::Put => -1.0,
+        };
+        let n1 = simd::norm_cdf_with_pdf(sign * d1, pdf_d1);
+        let n2 = simd::norm_cdf_with_pdf(sign * d2, pdf_d2);
+
+        let spot_term = s * disc_q * n1;
+        let strike_term = k * disc_r * n2;
+
+        PricingResult {
+            price: sign * (spot_term - strike_term),
+            delta: sign * disc_q * n1,
+            gamma: disc_q * pdf_d1 / (s * sigma_sqrt_t),
+            theta: -s * pdf_d1 * sigma * disc_q / (2.0 * sqrt_t)
+                + sign * (q * spot_term - r * strike_term),
+            // Vega and rho are divided by 100 to express them per 1% change
+            vega: s * disc_q * pdf_d1 * sqrt_t / 100.0,
+            rho: sign * strike_term * t / 100.0,
         }
     }
 }
@@ -377,4 +691,292 @@ mod tests {
         let put_result = BlackScholes::price(&params, OptionType::Put).unwrap();
         assert!((put_result.price - 0.0).abs() < 1e-10);
     }
+
+    #[test]
+    fn test_known_values() {
+        let params = OptionParams {
+            spot_price: 100.0,
+            strike_price: 100.0,
+            time_to_expiry: 1.0,
+            risk_free_rate: 0.05,
+            volatility: 0.2,
+            dividend_yield: 0.0,
+        };
+
+        // Reference values from the closed-form Black-Scholes formula
+        let call = BlackScholes::price(&params, OptionType::Call).unwrap();
+        assert!((call.price - 10.450584).abs() < 1e-5);
+        assert!((call.delta - 0.636831).abs() < 1e-5);
+        assert!((call.gamma - 0.018762).abs() < 1e-5);
+        assert!((call.vega - 0.375245).abs() < 1e-5);
+
+        let put = BlackScholes::price(&params, OptionType::Put).unwrap();
+        assert!((put.price - 5.573526).abs() < 1e-5);
+    }
+
+    #[test]
+    fn test_put_call_parity() {
+        let params = OptionParams {
+            spot_price: 100.0,
+            strike_price: 105.0,
+            time_to_expiry: 0.5,
+            risk_free_rate: 0.03,
+            volatility: 0.25,
+            dividend_yield: 0.01,
+        };
+
+        let call = BlackScholes::price(&params, OptionType::Call).unwrap();
+        let put = BlackScholes::price(&params, OptionType::Put).unwrap();
+
+        let disc_r = (-params.risk_free_rate * params.time_to_expiry).exp();
+        let disc_q = (-params.dividend_yield * params.time_to_expiry).exp();
+
+        // C - P = S e^{-qT} - K e^{-rT}
+        let parity = params.spot_price * disc_q - params.strike_price * disc_r;
+        assert!((call.price - put.price - parity).abs() < 1e-10);
+        // Delta(C) - Delta(P) = e^{-qT}
+        assert!((call.delta - put.delta - disc_q).abs() < 1e-10);
+        // Gamma and vega do not depend on the option type
+        assert!((call.gamma - put.gamma).abs() < 1e-12);
+        assert!((call.vega - put.vega).abs() < 1e-12);
+    }
+
+    #[test]
+    fn test_batch_matches_single_pricing() {
+        let batch = BatchParams {
+            spot_prices: &[100.0, 100.0, 110.0],
+            strike_prices: &[95.0, 105.0, 100.0],
+            times_to_expiry: &[0.5, 1.0, 0.0],
+            risk_free_rates: &[0.03, 0.05, 0.05],
+            volatilities: &[0.25, 0.2, 0.2],
+            dividend_yields: &[0.01, 0.0, 0.0],
+            option_types: &[OptionType::Call, OptionType::Put, OptionType::Call],
+        };
+
+        let result = BlackScholes::price_batch(&batch).unwrap();
+        assert_eq!(result.len(), batch.len());
+
+        for i in 0..batch.len() {
+            let (params, option_type) = batch.contract(i);
+            let expected = BlackScholes::price(&params, option_type).unwrap();
+            let actual = result.get(i).unwrap();
+            assert!((actual.price - expected.price).abs() < 1e-5);
+            assert!((actual.delta - expected.delta).abs() < 1e-6);
+            assert!((actual.gamma - expected.gamma).abs() < 1e-6);
+            assert!((actual.theta - expected.theta).abs() < 1e-5);
+            assert!((actual.vega - expected.vega).abs() < 1e-6);
+            assert!((actual.rho - expected.rho).abs() < 1e-6);
+        }
+        assert_eq!(result.get(batch.len()), None);
+    }
+
+    #[test]
+    fn test_batch_partial_simd_chunk() {
+        // Seven contracts: one full four-lane chunk and a padded remainder
+        let strikes = [80.0, 90.0, 95.0, 100.0, 105.0, 110.0, 120.0];
+        let n = strikes.len();
+        let option_types: Vec<OptionType> = (0..n)
+            .map(|i| {
+                if i % 2 == 0 {
+                    OptionType::Call
+                } else {
+                    OptionType::Put
+                }
+            })
+            .collect();
+        let batch = BatchParams {
+            spot_prices: &[100.0; 7],
+            strike_prices: &strikes,
+            times_to_expiry: &[0.75; 7],
+            risk_free_rates: &[0.04; 7],
+            volatilities: &[0.3; 7],
+            dividend_yields: &[0.02; 7],
+            option_types: &option_types,
+        };
+
+        let result = BlackScholes::price_batch(&batch).unwrap();
+        assert_eq!(result.len(), n);
+
+        for i in 0..n {
+            let (params, option_type) = batch.contract(i);
+            let expected = BlackScholes::price(&params, option_type).unwrap();
+            assert!((result.price[i] - expected.price).abs() < 1e-5);
+            assert!((result.delta[i] - expected.delta).abs() < 1e-6);
+        }
+    }
+
+    #[test]
+    fn test_batch_f32_matches_f64() {
+        let strikes: Vec<f64> = (0..10).map(|i| 80.0 + 5.0 * i as f64).collect();
+        let n = strikes.len();
+        let option_types = vec![OptionType::Put; n];
+        let batch = BatchParams {
+            spot_prices: &vec![100.0; n],
+            strike_prices: &strikes,
+            times_to_expiry: &vec![0.5; n],
+            risk_free_rates: &vec![0.05; n],
+            volatilities: &vec![0.2; n],
+            dividend_yields: &vec![0.01; n],
+            option_types: &option_types,
+        };
+
+        let to_f32 = |values: &[f64]| values.iter().map(|&v| v as f32).collect::<Vec<f32>>();
+        let (spots, strikes32, expiries, rates, vols, divs) = (
+            to_f32(batch.spot_prices),
+            to_f32(batch.strike_prices),
+            to_f32(batch.times_to_expiry),
+            to_f32(batch.risk_free_rates),
+            to_f32(batch.volatilities),
+            to_f32(batch.dividend_yields),
+        );
+        let batch32 = BatchParams {
+            spot_prices: &spots,
+            strike_prices: &strikes32,
+            times_to_expiry: &expiries,
+            risk_free_rates: &rates,
+            volatilities: &vols,
+            dividend_yields: &divs,
+            option_types: &option_types,
+        };
+
+        let result = BlackScholes::price_batch(&batch).unwrap();
+        let result32 = BlackScholes::price_batch(&batch32).unwrap();
+        assert_eq!(result32.len(), n);
+
+        for i in 0..n {
+            assert!((f64::from(result32.price[i]) - result.price[i]).abs() < 1e-3);
+            assert!((f64::from(result32.delta[i]) - result.delta[i]).abs() < 1e-4);
+            assert!((f64::from(result32.vega[i]) - result.vega[i]).abs() < 1e-4);
+        }
+    }
+
+    #[test]
+    fn test_batch_parallel_blocks() {
+        // Large enough to be split into several parallel blocks
+        let n = 10_001;
+        let strikes: Vec<f64> = (0..n).map(|i| 50.0 + (i % 100) as f64).collect();
+        let expiries: Vec<f64> = (0..n)
+            .map(|i| if i % 1000 == 0 { 0.0 } else { 0.25 })
+            .collect();
+        let option_types: Vec<OptionType> = (0..n)
+            .map(|i| {
+                if i % 3 == 0 {
+                    OptionType::Put
+                } else {
+                    OptionType::Call
+                }
+            })
+            .collect();
+        let batch = BatchParams {
+            spot_prices: &vec![100.0; n],
+            strike_prices: &strikes,
+            times_to_expiry: &expiries,
+            risk_free_rates: &vec![0.05; n],
+            volatilities: &vec![0.3; n],
+            dividend_yields: &vec![0.0; n],
+            option_types: &option_types,
+        };
+
+        let result = BlackScholes::price_batch(&batch).unwrap();
+        assert_eq!(result.len(), n);
+
+        for i in (0..n).step_by(97).chain([0, 4096, 5000, n - 1]) {
+            let (params, option_type) = batch.contract(i);
+            let expected = BlackScholes::price(&params, option_type).unwrap();
+            assert!(
+                (result.price[i] - expected.price).abs() < 1e-5,
+                "contract {}",
+                i
+            );
+            assert!(
+                (result.delta[i] - expected.delta).abs() < 1e-6,
+                "contract {}",
+                i
+            );
+        }
+    }
+
+    #[test]
+    fn test_ladder_matches_single_pricing() {
+        let params = OptionParams {
+            spot_price: 100.0,
+            strike_price: 0.0,
+            time_to_expiry: 0.75,
+            risk_free_rate: 0.04,
+            volatility: 0.3,
+            dividend_yield: 0.02,
+        };
+        let strikes: Vec<f64> = (0..11).map(|i| 75.0 + 5.0 * i as f64).collect();
+
+        for option_type in [OptionType::Call, OptionType::Put] {
+            let result = BlackScholes::price_ladder(&params, &strikes, option_type).unwrap();
+            assert_eq!(result.len(), strikes.len());
+
+            for (i, &strike) in strikes.iter().enumerate() {
+                let contract = OptionParams {
+                    strike_price: strike,
+                    ..params.clone()
+                };
+                let expected = BlackScholes::price(&contract, option_type).unwrap();
+                let actual = result.get(i).unwrap();
+                assert!((actual.price - expected.price).abs() < 1e-5);
+                assert!((actual.delta - expected.delta).abs() < 1e-6);
+                assert!((actual.gamma - expected.gamma).abs() < 1e-6);
+                assert!((actual.theta - expected.theta).abs() < 1e-5);
+                assert!((actual.vega - expected.vega).abs() < 1e-6);
+                assert!((actual.rho - expected.rho).abs() < 1e-6);
+            }
+        }
+    }
+
+    #[test]
+    fn test_ladder_at_expiry_and_invalid_strike() {
+        let params = OptionParams {
+            spot_price: 110.0,
+            strike_price: 0.0,
+            time_to_expiry: 0.0,
+            risk_free_rate: 0.05,
+            volatility: 0.2,
+            dividend_yield: 0.0,
+        };
+
+        let result =
+            BlackScholes::price_ladder(&params, &[100.0_f64, 120.0], OptionType::Call).unwrap();
+        assert!((result.price[0] - 10.0).abs() < 1e-10);
+        assert_eq!(result.price[1], 0.0);
+
+        let invalid = BlackScholes::price_ladder(&params, &[100.0_f64, 0.0], OptionType::Call);
+        assert!(invalid.is_err());
+    }
+
+    #[test]
+    fn test_batch_invalid_contract() {
+        let batch = BatchParams {
+            spot_prices: &[100.0, 100.0],
+            strike_prices: &[100.0, -1.0],
+            times_to_expiry: &[1.0, 1.0],
+            risk_free_rates: &[0.05, 0.05],
+            volatilities: &[0.2, 0.2],
+            dividend_yields: &[0.0, 0.0],
+            option_types: &[OptionType::Call, OptionType::Call],
+        };
+
+        assert!(BlackScholes::price_batch(&batch).is_err());
+    }
+
+    #[test]
+    fn test_batch_length_mismatch() {
+        let batch = BatchParams {
+            spot_prices: &[100.0, 100.0],
+            strike_prices: &[100.0],
+            times_to_expiry: &[1.0, 1.0],
+            risk_free_rates: &[0.05, 0.05],
+            volatilities: &[0.2, 0.2],
+            dividend_yields: &[0.0, 0.0],
+            option_types: &[OptionType::Call, OptionType::Call],
+        };
+
+        let result = BlackScholes::price_batch(&batch);
+        assert!(matches!(result, Err(PricingError::InvalidParameter(_))));
+    }
 }
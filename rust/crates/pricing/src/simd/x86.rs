@@ -0,0 +1,926 @@
+//! AVX2 and AVX-512 vectors for the pricing kernels
+//!
+//! Each type wraps a `std::arch` register and implements [`Lanes`], so the
+//! generic kernels in [`super`] can be compiled for wider registers than the
+//! baseline target provides. `exp` and `ln` have no instructions of their own;
+//! they are evaluated with the usual range reduction followed by a polynomial,
+//! accurate to a few ulp.
+//!
+//! The intrinsics are only valid on CPUs with the matching features. Values of
+//! these types are created solely inside the `#[target_feature]` entry points at
+//! the bottom of this module, which [`super`] calls only after detecting those
+//! features. Every method is `#[inline(always)]`, so it is compiled as part of
+//! the entry point, with its features enabled.
+
+use std::arch::x86_64::*;
+use std::f64::consts::{LOG2_E, SQRT_2};
+use std::ops::{Add, Div, Mul, Neg, Sub};
+
+use super::{BatchColumns, LadderInvariants, Lanes, PAD};
+use crate::BatchParams;
+
+/// AVX2 vector of four `f64` lanes
+#[derive(Clone, Copy)]
+struct Avx2F64x4(__m256d);
+
+/// AVX2 vector of eight `f32` lanes
+#[derive(Clone, Copy)]
+struct Avx2F32x8(__m256);
+
+/// AVX-512 vector of eight `f64` lanes
+#[derive(Clone, Copy)]
+struct Avx512F64x8(__m512d);
+
+/// AVX-512 vector of sixteen `f32` lanes
+#[derive(Clone, Copy)]
+struct Avx512F32x16(__m512);
+
+/// Implements the arithmetic operators with the given intrinsics
+macro_rules! arithmetic {
+    ($vector:ident, $add:ident, $sub:ident, $mul:ident, $div:ident) => {
+        impl Add for $vector {
+            type Output = Self;
+
+            #[inline(always)]
+            fn add(self, rhs: Self) -> Self {
+                // SAFETY: see the module documentation
+                unsafe { Self($add(self.0, rhs.0)) }
+            }
+        }
+
+        impl Sub for $vector {
+            type Output = Self;
+
+            #[inline(always)]
+            fn sub(self, rhs: Self) -> Self {
+                // SAFETY: see the module documentation
+                unsafe { Self($sub(self.0, rhs.0)) }
+            }
+        }
+
+        impl Mul for $vector {
+            type Output = Self;
+
+            #[inline(always)]
+            fn mul(self, rhs: Self) -> Self {
+                // SAFETY: see the module documentation
+                unsafe { Self($mul(self.0, rhs.0)) }
+            }
+        }
+
+        impl Div for $vector {
+            type Output = Self;
+
+            #[inline(always)]
+            fn div(self, rhs: Self) -> Self {
+                // SAFETY: see the module documentation
+                unsafe { Self($div(self.0, rhs.0)) }
+            }
+        }
+    };
+}
+
+arithmetic!(
+    Avx2F64x4,
+    _mm256_add_pd,
+    _mm256_sub_pd,
+    _mm256_mul_pd,
+    _mm256_div_pd
+);
+arithmetic!(
+    Avx2F32x8,
+    _mm256_add_ps,
+    _mm256_sub_ps,
+    _mm256_mul_ps,
+    _mm256_div_ps
+);
+arithmetic!(
+    Avx512F64x8,
+    _mm512_add_pd,
+    _mm512_sub_pd,
+    _mm512_mul_pd,
+    _mm512_div_pd
+);
+arithmetic!(
+    Avx512F32x16,
+    _mm512_add_ps,
+    _mm512_sub_ps,
+    _mm512_mul_ps,
+    _mm512_div_ps
+);
+
+/// Bit-level operations and constants behind the vectorised `exp` and `ln`
+trait Ieee: Lanes {
+    /// `1.5 * 2^p` for `p` mantissa bits; adding and then subtracting it
+    /// rounds to the nearest integer
+    const ROUND_MAGIC: f64;
+
+    /// Exponent bias
+    const BIAS: f64;
+
+    /// `exp` returns zero below this argument and infinity above `EXP_MAX`
+    const EXP_MIN: f64;
+    const EXP_MAX: f64;
+
+    /// `ln 2` split into a high part whose products with the exponent are
+    /// exact, and the remainder
+    const LN_2_HI: f64;
+    const LN_2_LO: f64;
+
+    /// Taylor coefficients `1 / k!` of `e^r` for `|r| <= ln(2) / 2`
+    const EXP_POLY: &'static [f64];
+
+    /// Coefficients `2 / (2k + 1)` of the series `ln(m) = 2 atanh(s)` in `s^2`
+    const LN_POLY: &'static [f64];
+
+    fn min(self, other: Self) -> Self;
+
+    fn max(self, other: Self) -> Self;
+
+    /// Returns `2^n` for lanes holding integers `n` in the normal exponent range
+    fn pow2(n: Self) -> Self;
+
+    /// Splits positive normal lanes into `(e, m)` with `self = m * 2^e` and
+    /// `m` in `[1, 2)`
+    fn frexp(self) -> (Self, Self);
+}
+
+const F64_EXP_POLY: [f64; 14] = [
+    1.0,
+    1.0,
+    1.0 / 2.0,
+    1.0 / 6.0,
+    1.0 / 24.0,
+    1.0 / 120.0,
+    1.0 / 720.0,
+    1.0 / 5_040.0,
+    1.0 / 40_320.0,
+    1.0 / 362_880.0,
+    1.0 / 3_628_800.0,
+    1.0 / 39_916_800.0,
+    1.0 / 479_001_600.0,
+    1.0 / 6_227_020_800.0,
+];
+
+const F64_LN_POLY: [f64; 11] = [
+    2.0,
+    2.0 / 3.0,
+    2.0 / 5.0,
+    2.0 / 7.0,
+    2.0 / 9.0,
+    2.0 / 11.0,
+    2.0 / 13.0,
+    2.0 / 15.0,
+    2.0 / 17.0,
+    2.0 / 19.0,
+    2.0 / 21.0,
+];
+
+const F32_EXP_POLY: [f64; 8] = [
+    1.0,
+    1.0,
+    1.0 / 2.0,
+    1.0 / 6.0,
+    1.0 / 24.0,
+    1.0 / 120.0,
+    1.0 / 720.0,
+    1.0 / 5_040.0,
+];
+
+const F32_LN_POLY: [f64; 5] = [2.0, 2.0 / 3.0, 2.0 / 5.0, 2.0 / 7.0, 2.0 / 9.0];
+
+/// Constants of [`Ieee`] for `f64` lanes
+macro_rules! f64_constants {
+    () => {
+        const ROUND_MAGIC: f64 = 6_755_399_441_055_744.0;
+        const BIAS: f64 = 1023.0;
+        const EXP_MIN: f64 = -708.0;
+        const EXP_MAX: f64 = 709.0;
+        const LN_2_HI: f64 = 6.931_471_803_691_238_164_90e-1;
+        const LN_2_LO: f64 = 1.908_214_929_270_587_700_02e-10;
+        const EXP_POLY: &'static [f64] = &F64_EXP_POLY;
+        const LN_POLY: &'static [f64] = &F64_LN_POLY;
+    };
+}
+
+/// Constants of [`Ieee`] for `f32` lanes
+macro_rules! f32_constants {
+    () => {
+        const ROUND_MAGIC: f64 = 12_582_912.0;
+        const BIAS: f64 = 127.0;
+        const EXP_MIN: f64 = -87.0;
+        const EXP_MAX: f64 = 88.0;
+        const LN_2_HI: f64 = 0.693_145_751_953_125;
+        const LN_2_LO: f64 = 1.428_606_765_330_187_045e-6;
+        const EXP_POLY: &'static [f64] = &F32_EXP_POLY;
+        const LN_POLY: &'static [f64] = &F32_LN_POLY;
+    };
+}
+
+/// Evaluates the polynomial with coefficients `coeffs`, lowest order first
+#[inline(always)]
+fn horner<V: Lanes>(coeffs: &[f64], x: V) -> V {
+    let (&last, rest) = coeffs.split_last().expect("polynomial has coefficients");
+    let mut acc = V::splat(last);
+    for &c in rest.iter().rev() {
+        acc = acc.mul_add(x, V::splat(c));
+    }
+    acc
+}
+
+/// Lane-wise `e^x`
+///
+/// `x = n ln(2) + r` with integer `n` and `|r| <= ln(2) / 2`, so that
+/// `e^x = 2^n e^r` with `e^r` from a short Taylor polynomial.
+#[inline(always)]
+fn exp<V: Ieee>(x: V) -> V {
+    // `max` and `min` return their second operand for NaN, so NaN propagates
+    let clamped = V::splat(V::EXP_MAX).min(V::splat(V::EXP_MIN).max(x));
+    let magic = V::splat(V::ROUND_MAGIC);
+    let n = (clamped * V::splat(LOG2_E) + magic) - magic;
+
+    // Two-step reduction, so that `r` keeps full precision
+    let r = n.mul_add(V::splat(-V::LN_2_HI), clamped);
+    let r = n.mul_add(V::splat(-V::LN_2_LO), r);
+    let value = horner(V::EXP_POLY, r) * V::pow2(n);
+
+    let value = (x - V::splat(V::EXP_MIN)).select_negative(V::splat(0.0), value);
+    (V::splat(V::EXP_MAX) - x).select_negative(V::splat(f64::INFINITY), value)
+}
+
+/// Lane-wise natural logarithm of positive normal values
+///
+/// `x = m 2^e` with `m` in `[sqrt(1/2), sqrt(2))`, so that
+/// `ln(x) = e ln(2) + 2 atanh(s)` with `s = (m - 1) / (m + 1)` and `|s| < 0.172`.
+#[inline(always)]
+fn ln<V: Ieee>(x: V) -> V {
+    let one = V::splat(1.0);
+    let (e, m) = x.frexp();
+
+    // Move mantissas above sqrt(2) to the lower half of the interval
+    let above = V::splat(SQRT_2) - m;
+    let m = above.select_negative(m * V::splat(0.5), m);
+    let e = above.select_negative(e + one, e);
+
+    let s = (m - one) / (m + one);
+    let ln_m = s * horner(V::LN_POLY, s * s);
+    let value = e.mul_add(V::splat(V::LN_2_HI), e.mul_add(V::splat(V::LN_2_LO), ln_m));
+
+    // `x - x` is zero for finite `x`, so only NaN reaches the result
+    value + (x - x)
+}
+
+impl Neg for Avx2F64x4 {
+    type Output = Self;
+
+    #[inline(always)]
+    fn neg(self) -> Self {
+        // SAFETY: see the module documentation
+        unsafe { Self(_mm256_xor_pd(self.0, _mm256_set1_pd(-0.0))) }
+    }
+}
+
+impl Lanes for Avx2F64x4 {
+    type Float = f64;
+    const LANES: usize = 4;
+
+    #[inline(always)]
+    fn splat(value: f64) -> Self {
+        // SAFETY: see the module documentation
+        unsafe { Self(_mm256_set1_pd(value)) }
+    }
+
+    #[inline(always)]
+    fn load(values: &[f64]) -> Self {
+        if values.len() == 4 {
+            // SAFETY: `values` holds four values; see also the module documentation
+            return unsafe { Self(_mm256_loadu_pd(values.as_ptr())) };
+        }
+        let mut lanes = [PAD; 4];
+        lanes[..values.len()].copy_from_slice(values);
+        // SAFETY: `lanes` holds four values; see also the module documentation
+        unsafe { Self(_mm256_loadu_pd(lanes.as_ptr())) }
+    }
+
+    #[inline(always)]
+    fn store(self, out: &mut [f64]) {
+        if out.len() == 4 {
+            // SAFETY: `out` holds four values; see also the module documentation
+            return unsafe { _mm256_storeu_pd(out.as_mut_ptr(), self.0) };
+        }
+        let mut lanes = [0.0; 4];
+        // SAFETY: `lanes` holds four values; see also the module documentation
+        unsafe { _mm256_storeu_pd(lanes.as_mut_ptr(), self.0) };
+        out.copy_from_slice(&lanes[..out.len()]);
+    }
+
+    #[inline(always)]
+    fn mul_add(self, m: Self, a: Self) -> Self {
+        // SAFETY: see the module documentation
+        unsafe { Self(_mm256_fmadd_pd(self.0, m.0, a.0)) }
+    }
+
+    #[inline(always)]
+    fn sqrt(self) -> Self {
+        // SAFETY: see the module documentation
+        unsafe { Self(_mm256_sqrt_pd(self.0)) }
+    }
+
+    #[inline(always)]
+    fn abs(self) -> Self {
+        // SAFETY: see the module documentation
+        unsafe { Self(_mm256_andnot_pd(_mm256_set1_pd(-0.0), self.0)) }
+    }
+
+    #[inline(always)]
+    fn exp(self) -> Self {
+        exp(self)
+    }
+
+    #[inline(always)]
+    fn ln(self) -> Self {
+        ln(self)
+    }
+
+    #[inline(always)]
+    fn select_negative(self, negative: Self, otherwise: Self) -> Self {
+        // SAFETY: see the module documentation
+        unsafe {
+            let mask = _mm256_cmp_pd::<_CMP_LT_OQ>(self.0, _mm256_setzero_pd());
+            Self(_mm256_blendv_pd(otherwise.0, negative.0, mask))
+        }
+    }
+}
+
+impl Ieee for Avx2F64x4 {
+    f64_constants!();
+
+    #[inline(always)]
+    fn min(self, other: Self) -> Self {
+        // SAFETY: see the module documentation
+        unsafe { Self(_mm256_min_pd(self.0, other.0)) }
+    }
+
+    #[inline(always)]
+    fn max(self, other: Self) -> Self {
+        // SAFETY: see the module documentation
+        unsafe { Self(_mm256_max_pd(self.0, other.0)) }
+    }
+
+    #[inline(always)]
+    fn pow2(n: Self) -> Self {
+        // The biased exponent lands in the low mantissa bits of the sum
+        let biased = n + Self::splat(Self::ROUND_MAGIC + Self::BIAS);
+        // SAFETY: see the module documentation
+        unsafe {
+            let bits = _mm256_slli_epi64::<52>(_mm256_castpd_si256(biased.0));
+            Self(_mm256_castsi256_pd(bits))
+        }
+    }
+
+    #[inline(always)]
+    fn frexp(self) -> (Self, Self) {
+        // SAFETY: see the module documentation
+        unsafe {
+            // The exponent field ORed into the mantissa of 2^52 is 2^52 + field
+            let field = _mm256_srli_epi64::<52>(_mm256_castpd_si256(self.0));
+            let two_52 = _mm256_set1_pd(4_503_599_627_370_496.0);
+            let biased = _mm256_sub_pd(_mm256_or_pd(_mm256_castsi256_pd(field), two_52), two_52);
+
+            let mantissa_mask = _mm256_castsi256_pd(_mm256_set1_epi64x(0x000f_ffff_ffff_ffff));
+            let mantissa = _mm256_or_pd(_mm256_and_pd(self.0, mantissa_mask), _mm256_set1_pd(1.0));
+
+            (Self(biased) - Self::splat(Self::BIAS), Self(mantissa))
+        }
+    }
+}
+
+impl Neg for Avx2F32x8 {
+    type Output = Self;
+
+    #[inline(always)]
+    fn neg(self) -> Self {
+        // SAFETY: see the module documentation
+        unsafe { Self(_mm256_xor_ps(self.0, _mm256_set1_ps(-0.0))) }
+    }
+}
+
+impl Lanes for Avx2F32x8 {
+    type Float = f32;
+    const LANES: usize = 8;
+
+    #[inline(always)]
+    fn splat(value: f64) -> Self {
+        // SAFETY: see the module documentation
+        unsafe { Self(_mm256_set1_ps(value as f32)) }
+    }
+
+    #[inline(always)]
+    fn load(values: &[f32]) -> Self {
+        if values.len() == 8 {
+            // SAFETY: `values` holds eight values; see also the module documentation
+            return unsafe { Self(_mm256_loadu_ps(values.as_ptr())) };
+        }
+        let mut lanes = [PAD as f32; 8];
+        lanes[..values.len()].copy_from_slice(values);
+        // SAFETY: `lanes` holds eight values; see also the module documentation
+        unsafe { Self(_mm256_loadu_ps(lanes.as_ptr())) }
+    }
+
+    #[inline(always)]
+    fn store(self, out: &mut [f32]) {
+        if out.len() == 8 {
+            // SAFETY: `out` holds eight values; see also the module documentation
+            return unsafe { _mm256_storeu_ps(out.as_mut_ptr(), self.0) };
+        }
+        let mut lanes = [0.0; 8];
+        // SAFETY: `lanes` holds eight values; see also the module documentation
+        unsafe { _mm256_storeu_ps(lanes.as_mut_ptr(), self.0) };
+        out.copy_from_slice(&lanes[..out.len()]);
+    }
+
+    #[inline(always)]
+    fn mul_add(self, m: Self, a: Self) -> Self {
+        // SAFETY: see the module documentation
+        unsafe { Self(_mm256_fmadd_ps(self.0, m.0, a.0)) }
+    }
+
+    #[inline(always)]
+    fn sqrt(self) -> Self {
+        // SAFETY: see the module documentation
+        unsafe { Self(_mm256_sqrt_ps(self.0)) }
+    }
+
+    #[inline(always)]
+    fn abs(self) -> Self {
+        // SAFETY: see the module documentation
+        unsafe { Self(_mm256_andnot_ps(_mm256_set1_ps(-0.0), self.0)) }
+    }
+
+    #[inline(always)]
+    fn exp(self) -> Self {
+        exp(self)
+    }
+
+    #[inline(always)]
+    fn ln(self) -> Self {
+        ln(self)
+    }
+
+    #[inline(always)]
+    fn select_negative(self, negative: Self, otherwise: Self) -> Self {
+        // SAFETY: see the module documentation
+        unsafe {
+            let mask = _mm256_cmp_ps::<_CMP_LT_OQ>(self.0, _mm256_setzero_ps());
+            Self(_mm256_blendv_ps(otherwise.0, negative.0, mask))
+        }
+    }
+}
+
+impl Ieee for Avx2F32x8 {
+    f32_constants!();
+
+    #[inline(always)]
+    fn min(self, other: Self) -> Self {
+        // SAFETY: see the module documentation
+        unsafe { Self(_mm256_min_ps(self.0, other.0)) }
+    }
+
+    #[inline(always)]
+    fn max(self, other: Self) -> Self {
+        // SAFETY: see the module documentation
+        unsafe { Self(_mm256_max_ps(self.0, other.0)) }
+    }
+
+    #[inline(always)]
+    fn pow2(n: Self) -> Self {
+        // The biased exponent lands in the low mantissa bits of the sum
+        let biased = n + Self::splat(Self::ROUND_MAGIC + Self::BIAS);
+        // SAFETY: see the module documentation
+        unsafe {
+            let bits = _mm256_slli_epi32::<23>(_mm256_castps_si256(biased.0));
+            Self(_mm256_castsi256_ps(bits))
+        }
+    }
+
+    #[inline(always)]
+    fn frexp(self) -> (Self, Self) {
+        // SAFETY: see the module documentation
+        unsafe {
+            // The exponent field ORed into the mantissa of 2^23 is 2^23 + field
+            let field = _mm256_srli_epi32::<23>(_mm256_castps_si256(self.0));
+            let two_23 = _mm256_set1_ps(8_388_608.0);
+            let biased = _mm256_sub_ps(_mm256_or_ps(_mm256_castsi256_ps(field), two_23), two_23);
+
+            let mantissa_mask = _mm256_castsi256_ps(_mm256_set1_epi32(0x007f_ffff));
+            let mantissa = _mm256_or_ps(_mm256_and_ps(self.0, mantissa_mask), _mm256_set1_ps(1.0));
+
+            (Self(biased) - Self::splat(Self::BIAS), Self(mantissa))
+        }
+    }
+}
+
+impl Neg for Avx512F64x8 {
+    type Output = Self;
+
+    #[inline(always)]
+    fn neg(self) -> Self {
+        // SAFETY: see the module documentation
+        unsafe {
+            let bits = _mm512_xor_si512(_mm512_castpd_si512(self.0), _mm512_set1_epi64(i64::MIN));
+            Self(_mm512_castsi512_pd(bits))
+        }
+    }
+}
+
+impl Lanes for Avx512F64x8 {
+    type Float = f64;
+    const LANES: usize = 8;
+
+    #[inline(always)]
+    fn splat(value: f64) -> Self {
+        // SAFETY: see the module documentation
+        unsafe { Self(_mm512_set1_pd(value)) }
+    }
+
+    #[inline(always)]
+    fn load(values: &[f64]) -> Self {
+        if values.len() == 8 {
+            // SAFETY: `values` holds eight values; see also the module documentation
+            return unsafe { Self(_mm512_loadu_pd(values.as_ptr())) };
+        }
+        let mut lanes = [PAD; 8];
+        lanes[..values.len()].copy_from_slice(values);
+        // SAFETY: `lanes` holds eight values; see also the module documentation
+        unsafe { Self(_mm512_loadu_pd(lanes.as_ptr())) }
+    }
+
+    #[inline(always)]
+    fn store(self, out: &mut [f64]) {
+        if out.len() == 8 {
+            // SAFETY: `out` holds eight values; see also the module documentation
+            return unsafe { _mm512_storeu_pd(out.as_mut_ptr(), self.0) };
+        }
+        let mut lanes = [0.0; 8];
+        // SAFETY: `lanes` holds eight values; see also the module documentation
+        unsafe { _mm512_storeu_pd(lanes.as_mut_ptr(), self.0) };
+        out.copy_from_slice(&lanes[..out.len()]);
+    }
+
+    #[inline(always)]
+    fn mul_add(self, m: Self, a: Self) -> Self {
+        // SAFETY: see the module documentation
+        unsafe { Self(_mm512_fmadd_pd(self.0, m.0, a.0)) }
+    }
+
+    #[inline(always)]
+    fn sqrt(self) -> Self {
+        // SAFETY: see the module documentation
+        unsafe { Self(_mm512_sqrt_pd(self.0)) }
+    }
+
+    #[inline(always)]
+    fn abs(self) -> Self {
+        // SAFETY: see the module documentation
+        unsafe { Self(_mm512_abs_pd(self.0)) }
+    }
+
+    #[inline(always)]
+    fn exp(self) -> Self {
+        exp(self)
+    }
+
+    #[inline(always)]
+    fn ln(self) -> Self {
+        ln(self)
+    }
+
+    #[inline(always)]
+    fn select_negative(self, negative: Self, otherwise: Self) -> Self {
+        // SAFETY: see the module documentation
+        unsafe {
+            let mask = _mm512_cmp_pd_mask::<_CMP_LT_OQ>(self.0, _mm512_setzero_pd());
+            Self(_mm512_mask_blend_pd(mask, otherwise.0, negative.0))
+        }
+    }
+}
+
+impl Ieee for Avx512F64x8 {
+    f64_constants!();
+
+    #[inline(always)]
+    fn min(self, other: Self) -> Self {
+        // SAFETY: see the module documentation
+        unsafe { Self(_mm512_min_pd(self.0, other.0)) }
+    }
+
+    #[inline(always)]
+    fn max(self, other: Self) -> Self {
+        // SAFETY: see the module documentation
+        unsafe { Self(_mm512_max_pd(self.0, other.0)) }
+    }
+
+    #[inline(always)]
+    fn pow2(n: Self) -> Self {
+        // The biased exponent lands in the low mantissa bits of the sum
+        let biased = n + Self::splat(Self::ROUND_MAGIC + Self::BIAS);
+        // SAFETY: see the module documentation
+        unsafe {
+            let bits = _mm512_slli_epi64::<52>(_mm512_castpd_si512(biased.0));
+            Self(_mm512_castsi512_pd(bits))
+        }
+    }
+
+    #[inline(always)]
+    fn frexp(self) -> (Self, Self) {
+        // SAFETY: see the module documentation
+        unsafe {
+            let bits = _mm512_castpd_si512(self.0);
+
+            // The exponent field ORed into the mantissa of 2^52 is 2^52 + field
+            let field = _mm512_srli_epi64::<52>(bits);
+            let two_52 = _mm512_set1_pd(4_503_599_627_370_496.0);
+            let field = _mm512_or_si512(field, _mm512_castpd_si512(two_52));
+            let biased = _mm512_sub_pd(_mm512_castsi512_pd(field), two_52);
+
+            let mantissa = _mm512_and_si512(bits, _mm512_set1_epi64(0x000f_ffff_ffff_ffff));
+            let one = _mm512_castpd_si512(_mm512_set1_pd(1.0));
+            let mantissa = _mm512_castsi512_pd(_mm512_or_si512(mantissa, one));
+
+            (Self(biased) - Self::splat(Self::BIAS), Self(mantissa))
+        }
+    }
+}
+
+impl Neg for Avx512F32x16 {
+    type Output = Self;
+
+    #[inline(always)]
+    fn neg(self) -> Self {
+        // SAFETY: see the module documentation
+        unsafe {
+            let bits = _mm512_xor_si512(_mm512_castps_si512(self.0), _mm512_set1_epi32(i32::MIN));
+            Self(_mm512_castsi512_ps(bits))
+        }
+    }
+}
+
+impl Lanes for Avx512F32x16 {
+    type Float = f32;
+    const LANES: usize = 16;
+
+    #[inline(always)]
+    fn splat(value: f64) -> Self {
+        // SAFETY: see the module documentation
+        unsafe { Self(_mm512_set1_ps(value as f32)) }
+    }
+
+    #[inline(always)]
+    fn load(values: &[f32]) -> Self {
+        if values.len() == 16 {
+            // SAFETY: `values` holds sixteen values; see also the module documentation
+            return unsafe { Self(_mm512_loadu_ps(values.as_ptr())) };
+        }
+        let mut lanes = [PAD as f32; 16];
+        lanes[..values.len()].copy_from_slice(values);
+        // SAFETY: `lanes` holds sixteen values; see also the module documentation
+        unsafe { Self(_mm512_loadu_ps(lanes.as_ptr())) }
+    }
+
+    #[inline(always)]
+    fn store(self, out: &mut [f32]) {
+        if out.len() == 16 {
+            // SAFETY: `out` holds sixteen values; see also the module documentation
+            return unsafe { _mm512_storeu_ps(out.as_mut_ptr(), self.0) };
+        }
+        let mut lanes = [0.0; 16];
+        // SAFETY: `lanes` holds sixteen values; see also the module documentation
+        unsafe { _mm512_storeu_ps(lanes.as_mut_ptr(), self.0) };
+        out.copy_from_slice(&lanes[..out.len()]);
+    }
+
+    #[inline(always)]
+    fn mul_add(self, m: Self, a: Self) -> Self {
+        // SAFETY: see the module documentation
+        unsafe { Self(_mm512_fmadd_ps(self.0, m.0, a.0)) }
+    }
+
+    #[inline(always)]
+    fn sqrt(self) -> Self {
+        // SAFETY: see the module documentation
+        unsafe { Self(_mm512_sqrt_ps(self.0)) }
+    }
+
+    #[inline(always)]
+    fn abs(self) -> Self {
+        // SAFETY: see the module documentation
+        unsafe { Self(_mm512_abs_ps(self.0)) }
+    }
+
+    #[inline(always)]
+    fn exp(self) -> Self {
+        exp(self)
+    }
+
+    #[inline(always)]
+    fn ln(self) -> Self {
+        ln(self)
+    }
+
+    #[inline(always)]
+    fn select_negative(self, negative: Self, otherwise: Self) -> Self {
+        // SAFETY: see the module documentation
+        unsafe {
+            let mask = _mm512_cmp_ps_mask::<_CMP_LT_OQ>(self.0, _mm512_setzero_ps());
+            Self(_mm512_mask_blend_ps(mask, otherwise.0, negative.0))
+        }
+    }
+}
+
+impl Ieee for Avx512F32x16 {
+    f32_constants!();
+
+    #[inline(always)]
+    fn min(self, other: Self) -> Self {
+        // SAFETY: see the module documentation
+        unsafe { Self(_mm512_min_ps(self.0, other.0)) }
+    }
+
+    #[inline(always)]
+    fn max(self, other: Self) -> Self {
+        // SAFETY: see the module documentation
+        unsafe { Self(_mm512_max_ps(self.0, other.0)) }
+    }
+
+    #[inline(always)]
+    fn pow2(n: Self) -> Self {
+        // The biased exponent lands in the low mantissa bits of the sum
+        let biased = n + Self::splat(Self::ROUND_MAGIC + Self::BIAS);
+        // SAFETY: see the module documentation
+        unsafe {
+            let bits = _mm512_slli_epi32::<23>(_mm512_castps_si512(biased.0));
+            Self(_mm512_castsi512_ps(bits))
+        }
+    }
+
+    #[inline(always)]
+    fn frexp(self) -> (Self, Self) {
+        // SAFETY: see the module documentation
+        unsafe {
+            let bits = _mm512_castps_si512(self.0);
+
+            // The exponent field ORed into the mantissa of 2^23 is 2^23 + field
+            let field = _mm512_srli_epi32::<23>(bits);
+            let two_23 = _mm512_set1_ps(8_388_608.0);
+            let field = _mm512_or_si512(field, _mm512_castps_si512(two_23));
+            let biased = _mm512_sub_ps(_mm512_castsi512_ps(field), two_23);
+
+            let mantissa = _mm512_and_si512(bits, _mm512_set1_epi32(0x007f_ffff));
+            let one = _mm512_castps_si512(_mm512_set1_ps(1.0));
+            let mantissa = _mm512_castsi512_ps(_mm512_or_si512(mantissa, one));
+
+            (Self(biased) - Self::splat(Self::BIAS), Self(mantissa))
+        }
+    }
+}
+
+/// Defines the `#[target_feature]` entry points of the kernels for one vector
+macro_rules! entry_points {
+    ($feature:literal, $vector:ty, $float:ty, $price_batch:ident, $price_ladder:ident) => {
+        /// Batch pricing kernel; the CPU must support the target features
+        #[target_feature(enable = $feature)]
+        pub(super) unsafe fn $price_batch(
+            params: &BatchParams<'_, $float>,
+            out: BatchColumns<'_, $float>,
+        ) {
+            super::price_batch::<$vector>(params, out);
+        }
+
+        /// Strike ladder kernel; the CPU must support the target features
+        #[target_feature(enable = $feature)]
+        pub(super) unsafe fn $price_ladder(
+            ladder: &LadderInvariants,
+            strikes: &[$float],
+            out: BatchColumns<'_, $float>,
+        ) {
+            super::price_ladder::<$vector>(ladder, strikes, out);
+        }
+    };
+}
+
+entry_points!(
+    "avx2,fma",
+    Avx2F64x4,
+    f64,
+    price_batch_avx2_f64,
+    price_ladder_avx2_f64
+);
+entry_points!(
+    "avx2,fma",
+    Avx2F32x8,
+    f32,
+    price_batch_avx2_f32,
+    price_ladder_avx2_f32
+);
+entry_points!(
+    "avx512f",
+    Avx512F64x8,
+    f64,
+    price_batch_avx512_f64,
+    price_ladder_avx512_f64
+);
+entry_points!(
+    "avx512f",
+    Avx512F32x16,
+    f32,
+    price_batch_avx512_f32,
+    price_ladder_avx512_f32
+);
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    /// Arguments of `exp`, covering the ones Black-Scholes produces
+    fn exp_arguments() -> impl Iterator<Item = f64> {
+        (-2000..=200).map(|i| f64::from(i) * 0.3 + 0.0123)
+    }
+
+    /// Arguments of `ln`, from deep out-of-the-money ratios to large strikes
+    fn ln_arguments() -> impl Iterator<Item = f64> {
+        (-300..=300).map(|i| (f64::from(i) * 0.071).exp() * 1.0007)
+    }
+
+    /// Checks `exp` and `ln` of one vector type against the standard library
+    ///
+    /// Calling the methods outside a `#[target_feature]` function is correct,
+    /// only slower, so the features just have to be present at run time.
+    fn check_exp_ln<V: Ieee>(tolerance: f64, to_f64: impl Fn(V) -> f64) {
+        for x in exp_arguments() {
+            // Compare against the argument as rounded to the lane type
+            let x = to_f64(V::splat(x));
+            let actual = to_f64(exp(V::splat(x)));
+            if x < V::EXP_MIN {
+                assert_eq!(actual, 0.0, "exp({})", x);
+            } else {
+                let expected = x.exp();
+                assert!(
+                    (actual - expected).abs() <= tolerance * expected,
+                    "exp({}) = {}",
+                    x,
+                    actual
+                );
+            }
+        }
+        for x in ln_arguments() {
+            let x = to_f64(V::splat(x));
+            let actual = to_f64(ln(V::splat(x)));
+            let expected = x.ln();
+            assert!(
+                (actual - expected).abs() <= tolerance * expected.abs().max(1.0),
+                "ln({}) = {}",
+                x,
+                actual
+            );
+        }
+    }
+
+    fn first_lane<V: Lanes>(value: V) -> f64 {
+        let mut out = [<V::Float as crate::BatchFloat>::from_f64(0.0)];
+        value.store(&mut out);
+        crate::BatchFloat::to_f64(out[0])
+    }
+
+    #[test]
+    fn test_avx2_exp_ln_accuracy() {
+        if !(is_x86_feature_detected!("avx2") && is_x86_feature_detected!("fma")) {
+            return;
+        }
+        check_exp_ln::<Avx2F64x4>(1e-15, first_lane);
+        check_exp_ln::<Avx2F32x8>(1e-6, first_lane);
+    }
+
+    #[test]
+    fn test_avx512_exp_ln_accuracy() {
+        if !is_x86_feature_detected!("avx512f") {
+            return;
+        }
+        check_exp_ln::<Avx512F64x8>(1e-15, first_lane);
+        check_exp_ln::<Avx512F32x16>(1e-6, first_lane);
+    }
+
+    #[test]
+    fn test_exp_ln_special_values() {
+        if !(is_x86_feature_detected!("avx2") && is_x86_feature_detected!("fma")) {
+            return;
+        }
+        assert_eq!(first_lane(exp(Avx2F64x4::splat(f64::NEG_INFINITY))), 0.0);
+        assert_eq!(
+            first_lane(exp(Avx2F64x4::splat(f64::INFINITY))),
+            f64::INFINITY
+        );
+        assert!(first_lane(exp(Avx2F64x4::splat(f64::NAN))).is_nan());
+        assert!(first_lane(ln(Avx2F64x4::splat(f64::NAN))).is_nan());
+        assert_eq!(first_lane(ln(Avx2F64x4::splat(1.0))), 0.0);
+    }
+}
@@ -3,6 +3,10 @@
 //! This module exposes Rust implementations of option pricing and technical analysis
 //! indicators to Python via PyO3.
 //!
+//! All computations run with the GIL released, so calls made from several Python
+//! threads (for example through a `ThreadPoolExecutor`) execute in parallel.
+//! Large batches are additionally spread across cores inside a single call.
+//!
 //! # Installation
 //!
 //! Build and install with maturin:
@@ -26,7 +30,20 @@
 //!     dividend_yield=0.0,
 //!     option_type="call"
 //! )
-//! print(f"Price: {result['price']}, Delta: {result['delta']}")
+//! print(f"Price: {result.price}, Delta: {result.delta}")
+//!
+//! # Batch option pricing (one call for a whole chain)
+//! import numpy as np
+//! result = pyfinance.price_options_batch(
+//!     spot_prices=np.full(3, 100.0),
+//!     strike_prices=np.array([95.0, 100.0, 105.0]),
+//!     times_to_expiry=np.full(3, 0.5),
+//!     risk_free_rates=np.full(3, 0.05),
+//!     volatilities=np.full(3, 0.2),
+//!     dividend_yields=np.zeros(3),
+//!     is_call=np.array([True, True, False]),
+//! )
+//! print(f"Prices: {result['price']}")
 //!
 //! # EMA calculation
 //! ema = pyfinance.EMA(period=10)
@@ -35,10 +52,63 @@
 //! print(f"EMA values: {result}")
 //! ```
 
+use numpy::{Element, IntoPyArray, PyArray1, PyReadonlyArray1};
 use pyo3::prelude::*;
 use pyo3::exceptions::PyValueError;
 use pyo3::types::PyDict;
 
+/// Result of a single option pricing calculation
+///
+/// Exposed to Python as `pyfinance.PricingResult`, a read-only object with one
+/// attribute per output. Returning a fixed-layout object instead of a dictionary
+/// avoids building and hashing a dictionary on every call.
+#[pyclass(name = "PricingResult", frozen)]
+#[derive(Debug, Clone)]
+struct PyPricingResult {
+    /// Option price
+    #[pyo3(get)]
+    price: f64,
+    /// Delta Greek
+    #[pyo3(get)]
+    delta: f64,
+    /// Gamma Greek
+    #[pyo3(get)]
+    gamma: f64,
+    /// Theta Greek
+    #[pyo3(get)]
+    theta: f64,
+    /// Vega Greek
+    #[pyo3(get)]
+    vega: f64,
+    /// Rho Greek
+    #[pyo3(get)]
+    rho: f64,
+}
+
+impl From<pricing::PricingResult> for PyPricingResult {
+    fn from(result: pricing::PricingResult) -> Self {
+        Self {
+            price: result.price,
+            delta: result.delta,
+            gamma: result.gamma,
+            theta: result.theta,
+            vega: result.vega,
+            rho: result.rho,
+        }
+    }
+}
+
+#[pymethods]
+impl PyPricingResult {
+    /// String representation of the pricing result
+    fn __repr__(&self) -> String {
+        format!(
+            "PricingResult(price={}, delta={}, gamma={}, theta={}, vega={}, rho={})",
+            self.price, self.delta, self.gamma, self.theta, self.vega, self.rho
+        )
+    }
+}
+
 /// Python wrapper for option pricing
 ///
 /// # Arguments
@@ -53,7 +123,7 @@ use pyo3::types::PyDict;
 ///
 /// # Returns
 ///
-/// Dictionary containing:
+/// `PricingResult` with attributes:
 /// - `price`: Option price
 /// - `delta`: Delta Greek
 /// - `gamma`: Gamma Greek
@@ -62,8 +132,9 @@ use pyo3::types::PyDict;
 /// - `rho`: Rho Greek
 #[pyfunction]
 #[pyo3(signature = (spot_price, strike_price, time_to_expiry, risk_free_rate, volatility, dividend_yield, option_type))]
+#[allow(clippy::too_many_arguments)]
 fn price_option(
-    py: Python,
+    py: Python<'_>,
     spot_price: f64,
     strike_price: f64,
     time_to_expiry: f64,
@@ -71,7 +142,7 @@ fn price_option(
     volatility: f64,
     dividend_yield: f64,
     option_type: &str,
-) -> PyResult<PyObject> {
+) -> PyResult<PyPricingResult> {
     // Parse option type
     let opt_type = match option_type.to_lowercase().as_str() {
         "call" => pricing::OptionType::Call,
@@ -89,27 +160,290 @@ fn price_option(
         dividend_yield,
     };
 
-    // Calculate price
-    let result = pricing::BlackScholes::price(&params, opt_type)
+    // Calculate price with the GIL released
+    let result = py
+        .allow_threads(|| pricing::BlackScholes::price(&params, opt_type))
+        .map_err(|e| PyValueError::new_err(format!("Pricing error: {}", e)))?;
+
+    Ok(result.into())
+}
+
+/// Positional-only fast path for pricing a single option
+///
+/// Equivalent to `price_option`, but the arguments are positional-only and the
+/// option type is a boolean, so each call skips keyword parsing and the
+/// option type string comparison. Intended for tight Python loops. Like every
+/// other binding it prices with the GIL released, so loops split across Python
+/// threads run in parallel.
+///
+/// # Arguments
+///
+/// * `spot` - Current price of the underlying asset
+/// * `strike` - Strike price of the option
+/// * `t` - Time to expiry in years
+/// * `r` - Risk-free interest rate (annualized)
+/// * `sigma` - Volatility of the underlying asset (annualized)
+/// * `q` - Dividend yield (annualized)
+/// * `is_call` - `True` for a call option, `False` for a put option
+///
+/// # Example
+///
+/// ```python
+/// result = pyfinance.price_option_pos(100.0, 105.0, 1.0, 0.05, 0.2, 0.0, True)
+/// ```
+#[pyfunction]
+#[pyo3(signature = (spot, strike, t, r, sigma, q, is_call, /))]
+#[allow(clippy::too_many_arguments)]
+fn price_option_pos(
+    py: Python<'_>,
+    spot: f64,
+    strike: f64,
+    t: f64,
+    r: f64,
+    sigma: f64,
+    q: f64,
+    is_call: bool,
+) -> PyResult<PyPricingResult> {
+    let opt_type = if is_call {
+        pricing::OptionType::Call
+    } else {
+        pricing::OptionType::Put
+    };
+
+    let params = pricing::OptionParams {
+        spot_price: spot,
+        strike_price: strike,
+        time_to_expiry: t,
+        risk_free_rate: r,
+        volatility: sigma,
+        dividend_yield: q,
+    };
+
+    // Calculate price with the GIL released
+    let result = py
+        .allow_threads(|| pricing::BlackScholes::price(&params, opt_type))
         .map_err(|e| PyValueError::new_err(format!("Pricing error: {}", e)))?;
 
-    // Convert to Python dictionary
+    Ok(result.into())
+}
+
+/// Prices a batch of options from NumPy arrays of `f64` or `f32` values
+///
+/// The returned arrays have the same element type as the inputs.
+#[allow(clippy::too_many_arguments)]
+fn price_batch_arrays<'py, T>(
+    py: Python<'py>,
+    spot_prices: PyReadonlyArray1<'py, T>,
+    strike_prices: PyReadonlyArray1<'py, T>,
+    times_to_expiry: PyReadonlyArray1<'py, T>,
+    risk_free_rates: PyReadonlyArray1<'py, T>,
+    volatilities: PyReadonlyArray1<'py, T>,
+    dividend_yields: PyReadonlyArray1<'py, T>,
+    is_call: PyReadonlyArray1<'py, bool>,
+) -> PyResult<Bound<'py, PyDict>>
+where
+    T: pricing::BatchFloat + Element,
+{
+    let spot_prices = spot_prices.as_slice()?;
+    let strike_prices = strike_prices.as_slice()?;
+    let times_to_expiry = times_to_expiry.as_slice()?;
+    let risk_free_rates = risk_free_rates.as_slice()?;
+    let volatilities = volatilities.as_slice()?;
+    let dividend_yields = dividend_yields.as_slice()?;
+    let is_call = is_call.as_slice()?;
+
+    // Only plain slices are touched from here on, so the GIL can be released
+    let result = py
+        .allow_threads(|| {
+            let option_types: Vec<pricing::OptionType> = is_call
+                .iter()
+                .map(|&call| {
+                    if call {
+                        pricing::OptionType::Call
+                    } else {
+                        pricing::OptionType::Put
+                    }
+                })
+                .collect();
+
+            let params = pricing::BatchParams {
+                spot_prices,
+                strike_prices,
+                times_to_expiry,
+                risk_free_rates,
+                volatilities,
+                dividend_yields,
+                option_types: &option_types,
+            };
+
+            pricing::BlackScholes::price_batch(&params)
+        })
+        .map_err(|e| PyValueError::new_err(format!("Pricing error: {}", e)))?;
+
+    result_dict(py, result)
+}
+
+/// Converts a batch result into a dictionary of NumPy arrays
+fn result_dict<T>(
+    py: Python<'_>,
+    result: pricing::BatchPricingResult<T>,
+) -> PyResult<Bound<'_, PyDict>>
+where
+    T: pricing::BatchFloat + Element,
+{
+    // Each column is moved into a NumPy array without copying
     let dict = PyDict::new_bound(py);
-    dict.set_item("price", result.price)?;
-    dict.set_item("delta", result.delta)?;
-    dict.set_item("gamma", result.gamma)?;
-    dict.set_item("theta", result.theta)?;
-    dict.set_item("vega", result.vega)?;
-    dict.set_item("rho", result.rho)?;
-
-    Ok(dict.into())
+    dict.set_item("price", result.price.into_pyarray_bound(py))?;
+    dict.set_item("delta", result.delta.into_pyarray_bound(py))?;
+    dict.set_item("gamma", result.gamma.into_pyarray_bound(py))?;
+    dict.set_item("theta", result.theta.into_pyarray_bound(py))?;
+    dict.set_item("vega", result.vega.into_pyarray_bound(py))?;
+    dict.set_item("rho", result.rho.into_pyarray_bound(py))?;
+
+    Ok(dict)
+}
+
+/// Python wrapper for batch option pricing
+///
+/// Prices a whole batch of contracts in a single call. Each argument is a
+/// one-dimensional NumPy array with one entry per contract; all arrays must have
+/// the same length and be C-contiguous.
+///
+/// # Arguments
+///
+/// * `spot_prices` - Current prices of the underlying assets (`float64`)
+/// * `strike_prices` - Strike prices of the options (`float64`)
+/// * `times_to_expiry` - Times to expiry in years (`float64`)
+/// * `risk_free_rates` - Risk-free interest rates, annualized (`float64`)
+/// * `volatilities` - Volatilities of the underlying assets, annualized (`float64`)
+/// * `dividend_yields` - Dividend yields, annualized (`float64`)
+/// * `is_call` - `True` for call options, `False` for put options (`bool`)
+///
+/// # Returns
+///
+/// Dictionary mapping `price`, `delta`, `gamma`, `theta`, `vega` and `rho` to
+/// `float64` arrays with one entry per contract.
+#[pyfunction]
+#[pyo3(signature = (spot_prices, strike_prices, times_to_expiry, risk_free_rates, volatilities, dividend_yields, is_call))]
+#[allow(clippy::too_many_arguments)]
+fn price_options_batch<'py>(
+    py: Python<'py>,
+    spot_prices: PyReadonlyArray1<'py, f64>,
+    strike_prices: PyReadonlyArray1<'py, f64>,
+    times_to_expiry: PyReadonlyArray1<'py, f64>,
+    risk_free_rates: PyReadonlyArray1<'py, f64>,
+    volatilities: PyReadonlyArray1<'py, f64>,
+    dividend_yields: PyReadonlyArray1<'py, f64>,
+    is_call: PyReadonlyArray1<'py, bool>,
+) -> PyResult<Bound<'py, PyDict>> {
+    price_batch_arrays(
+        py,
+        spot_prices,
+        strike_prices,
+        times_to_expiry,
+        risk_free_rates,
+        volatilities,
+        dividend_yields,
+        is_call,
+    )
+}
+
+/// Python wrapper for single-precision batch option pricing
+///
+/// Same as `price_options_batch`, but takes and returns `float32` arrays. The
+/// single-precision kernel prices twice as many contracts per SIMD instruction
+/// and is accurate to roughly seven significant digits.
+#[pyfunction]
+#[pyo3(signature = (spot_prices, strike_prices, times_to_expiry, risk_free_rates, volatilities, dividend_yields, is_call))]
+#[allow(clippy::too_many_arguments)]
+fn price_options_batch_f32<'py>(
+    py: Python<'py>,
+    spot_prices: PyReadonlyArray1<'py, f32>,
+    strike_prices: PyReadonlyArray1<'py, f32>,
+    times_to_expiry: PyReadonlyArray1<'py, f32>,
+    risk_free_rates: PyReadonlyArray1<'py, f32>,
+    volatilities: PyReadonlyArray1<'py, f32>,
+    dividend_yields: PyReadonlyArray1<'py, f32>,
+    is_call: PyReadonlyArray1<'py, bool>,
+) -> PyResult<Bound<'py, PyDict>> {
+    price_batch_arrays(
+        py,
+        spot_prices,
+        strike_prices,
+        times_to_expiry,
+        risk_free_rates,
+        volatilities,
+        dividend_yields,
+        is_call,
+    )
+}
+
+/// Python wrapper for strike ladder pricing
+///
+/// Prices one option per strike, with every other parameter shared. The
+/// strike-independent terms (discount factors, `σ√T`, drift and the Greek
+/// scaling factors) are computed once for the whole ladder.
+///
+/// # Arguments
+///
+/// * `spot_price` - Current price of the underlying asset
+/// * `strike_prices` - Strike prices of the options (`float64` array)
+/// * `time_to_expiry` - Time to expiry in years
+/// * `risk_free_rate` - Risk-free interest rate (annualized)
+/// * `volatility` - Volatility of the underlying asset (annualized)
+/// * `dividend_yield` - Dividend yield (annualized)
+/// * `is_call` - `True` for call options, `False` for put options
+///
+/// # Returns
+///
+/// Dictionary mapping `price`, `delta`, `gamma`, `theta`, `vega` and `rho` to
+/// `float64` arrays with one entry per strike.
+#[pyfunction]
+#[pyo3(signature = (spot_price, strike_prices, time_to_expiry, risk_free_rate, volatility, dividend_yield, is_call))]
+#[allow(clippy::too_many_arguments)]
+fn price_strike_ladder<'py>(
+    py: Python<'py>,
+    spot_price: f64,
+    strike_prices: PyReadonlyArray1<'py, f64>,
+    time_to_expiry: f64,
+    risk_free_rate: f64,
+    volatility: f64,
+    dividend_yield: f64,
+    is_call: bool,
+) -> PyResult<Bound<'py, PyDict>> {
+    let strike_prices = strike_prices.as_slice()?;
+    let option_type = if is_call {
+        pricing::OptionType::Call
+    } else {
+        pricing::OptionType::Put
+    };
+
+    // The strike field is ignored; each entry of `strike_prices` is used instead
+    let params = pricing::OptionParams {
+        spot_price,
+        strike_price: 0.0,
+        time_to_expiry,
+        risk_free_rate,
+        volatility,
+        dividend_yield,
+    };
+
+    let result = py
+        .allow_threads(|| pricing::BlackScholes::price_ladder(&params, strike_prices, option_type))
+        .map_err(|e| PyValueError::new_err(format!("Pricing error: {}", e)))?;
+
+    result_dict(py, result)
 }
 
 /// Python wrapper for EMA (Exponential Moving Average) indicator
+///
+/// Besides batch calculation, the object keeps the current EMA value for
+/// streaming updates so that Python only passes in each new price.
 #[allow(clippy::upper_case_acronyms)]
 #[pyclass]
 struct EMA {
     inner: indicator::EMA,
+    current: Option<f64>,
 }
 
 #[pymethods]
@@ -119,28 +453,37 @@ impl EMA {
     /// # Arguments
     ///
     /// * `period` - Number of periods for the EMA calculation
+    /// * `seed` - Optional starting EMA value for streaming updates, for
+    ///   example one persisted before a restart
     ///
     /// # Example
     ///
     /// ```python
     /// ema = pyfinance.EMA(period=10)
+    /// resumed = pyfinance.EMA(period=10, seed=101.5)
     /// ```
     #[new]
-    fn new(period: usize) -> PyResult<Self> {
+    #[pyo3(signature = (period, seed=None))]
+    fn new(period: usize, seed: Option<f64>) -> PyResult<Self> {
         let inner = indicator::EMA::new(period)
             .map_err(|e| PyValueError::new_err(format!("EMA creation error: {}", e)))?;
-        Ok(Self { inner })
+        Ok(Self {
+            inner,
+            current: seed,
+        })
     }
 
     /// Calculate EMA for a batch of prices
     ///
+    /// Prefer `calculate_np` when the prices are already in a NumPy array.
+    ///
     /// # Arguments
     ///
     /// * `prices` - List of price values
     ///
     /// # Returns
     ///
-    /// List of EMA values. The first (period-1) values will be None.
+    /// `float64` array of EMA values. The first (period-1) values will be NaN.
     ///
     /// # Example
     ///
@@ -148,19 +491,65 @@ impl EMA {
     /// ema = pyfinance.EMA(period=3)
     /// prices = [10.0, 11.0, 12.0, 13.0, 14.0]
     /// result = ema.calculate(prices)
-    /// # result = [None, None, 11.0, 12.0, 13.0]
+    /// # result = array([nan, nan, 11.0, 12.0, 13.0])
+    /// ```
+    fn calculate<'py>(
+        &self,
+        py: Python<'py>,
+        prices: Vec<f64>,
+    ) -> PyResult<Bound<'py, PyArray1<f64>>> {
+        let mut out = vec![0.0; prices.len()];
+        let inner = &self.inner;
+        py.allow_threads(|| inner.calculate_into(&prices, &mut out))
+            .map_err(|e| PyValueError::new_err(format!("EMA calculation error: {}", e)))?;
+
+        Ok(out.into_pyarray_bound(py))
+    }
+
+    /// Calculate EMA for a NumPy array of prices
+    ///
+    /// The input is read in place as a contiguous `float64` slice and the
+    /// output is returned as a `float64` array, so no Python float objects are
+    /// created on either side.
+    ///
+    /// # Arguments
+    ///
+    /// * `prices` - One-dimensional, C-contiguous `float64` array of prices
+    ///
+    /// # Returns
+    ///
+    /// `float64` array of EMA values. The first (period-1) values will be NaN.
+    ///
+    /// # Example
+    ///
+    /// ```python
+    /// ema = pyfinance.EMA(period=3)
+    /// result = ema.calculate_np(np.array([10.0, 11.0, 12.0, 13.0, 14.0]))
+    /// # result = array([nan, nan, 11.0, 12.0, 13.0])
     /// ```
-    fn calculate(&self, prices: Vec<f64>) -> PyResult<Vec<Option<f64>>> {
-        self.inner
-            .calculate(&prices)
-            .map_err(|e| PyValueError::new_err(format!("EMA calculation error: {}", e)))
+    fn calculate_np<'py>(
+        &self,
+        py: Python<'py>,
+        prices: PyReadonlyArray1<'py, f64>,
+    ) -> PyResult<Bound<'py, PyArray1<f64>>> {
+        let prices = prices.as_slice()?;
+        let mut out = vec![0.0; prices.len()];
+        let inner = &self.inner;
+        py.allow_threads(|| inner.calculate_into(prices, &mut out))
+            .map_err(|e| PyValueError::new_err(format!("EMA calculation error: {}", e)))?;
+
+        // The buffer is moved into the NumPy array without copying
+        Ok(out.into_pyarray_bound(py))
     }
 
     /// Update EMA with a new price (streaming mode)
     ///
+    /// The current EMA value is kept inside the object, so each tick only
+    /// crosses the Python boundary with the new price. The first update
+    /// initializes the EMA to that price.
+    ///
     /// # Arguments
     ///
-    /// * `current_ema` - Current EMA value (or None if starting)
     /// * `new_price` - New price to incorporate
     ///
     /// # Returns
@@ -171,24 +560,43 @@ impl EMA {
     ///
     /// ```python
     /// ema = pyfinance.EMA(period=10)
-    /// current = None
-    /// current = ema.update(current, 100.0)
-    /// current = ema.update(current, 102.0)
+    /// ema.update(100.0)  # 100.0
+    /// ema.update(102.0)  # 100.36...
     /// ```
-    #[pyo3(signature = (current_ema, new_price))]
-    fn update(&self, current_ema: Option<f64>, new_price: f64) -> f64 {
-        self.inner.update(current_ema, new_price)
+    #[pyo3(signature = (new_price))]
+    fn update(&mut self, new_price: f64) -> f64 {
+        let ema = self.inner.update(self.current, new_price);
+        self.current = Some(ema);
+        ema
+    }
+
+    /// Reset the streaming state so the next update starts a new EMA
+    fn reset(&mut self) {
+        self.current = None;
+    }
+
+    /// Current streaming EMA value, or None before the first update
+    ///
+    /// Assigning restores a previously saved value; assigning None resets.
+    #[getter]
+    fn current(&self) -> Option<f64> {
+        self.current
+    }
+
+    #[setter]
+    fn set_current(&mut self, value: Option<f64>) {
+        self.current = value;
     }
 
-    /// Get the period used for EMA calculation
-    #[pyo3(name = "period")]
-    fn get_period(&self) -> usize {
+    /// Period used for EMA calculation
+    #[getter]
+    fn period(&self) -> usize {
         self.inner.period()
     }
 
-    /// Get the smoothing factor (alpha) used for EMA calculation
-    #[pyo3(name = "alpha")]
-    fn get_alpha(&self) -> f64 {
+    /// Smoothing factor (alpha) used for EMA calculation
+    #[getter]
+    fn alpha(&self) -> f64 {
         self.inner.alpha()
     }
 
@@ -198,10 +606,92 @@ impl EMA {
     }
 }
 
+/// Python wrapper for the streaming SMA (Simple Moving Average) indicator
+///
+/// The price window and its running sum live inside the object, so each
+/// update costs O(1) regardless of the period.
+#[allow(clippy::upper_case_acronyms)]
+#[pyclass]
+struct SMA {
+    inner: indicator::SMA,
+}
+
+#[pymethods]
+impl SMA {
+    /// Create a new SMA indicator with the specified period
+    ///
+    /// # Arguments
+    ///
+    /// * `period` - Number of periods for the SMA calculation
+    ///
+    /// # Example
+    ///
+    /// ```python
+    /// sma = pyfinance.SMA(period=20)
+    /// ```
+    #[new]
+    fn new(period: usize) -> PyResult<Self> {
+        let inner = indicator::SMA::new(period)
+            .map_err(|e| PyValueError::new_err(format!("SMA creation error: {}", e)))?;
+        Ok(Self { inner })
+    }
+
+    /// Update SMA with a new price (streaming mode)
+    ///
+    /// # Arguments
+    ///
+    /// * `new_price` - New price to incorporate
+    ///
+    /// # Returns
+    ///
+    /// SMA of the last `period` prices, or None until `period` prices have
+    /// been seen
+    ///
+    /// # Example
+    ///
+    /// ```python
+    /// sma = pyfinance.SMA(period=2)
+    /// sma.update(100.0)  # None
+    /// sma.update(102.0)  # 101.0
+    /// ```
+    #[pyo3(signature = (new_price))]
+    fn update(&mut self, new_price: f64) -> Option<f64> {
+        self.inner.update(new_price)
+    }
+
+    /// Reset the streaming state so the next update starts a new SMA
+    fn reset(&mut self) {
+        self.inner.reset();
+    }
+
+    /// Current SMA value, or None until `period` prices have been seen
+    #[getter]
+    fn current(&self) -> Option<f64> {
+        self.inner.current()
+    }
+
+    /// Period used for SMA calculation
+    #[getter]
+    fn period(&self) -> usize {
+        self.inner.period()
+    }
+
+    /// String representation of the SMA
+    fn __repr__(&self) -> String {
+        format!("SMA(period={})", self.inner.period())
+    }
+}
+
 /// Python module for financial calculations
 #[pymodule]
 fn pyfinance(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(price_option, m)?)?;
+    m.add_function(wrap_pyfunction!(price_option_pos, m)?)?;
+    m.add_function(wrap_pyfunction!(price_options_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(price_options_batch_f32, m)?)?;
+    m.add_function(wrap_pyfunction!(price_strike_ladder, m)?)?;
+    m.add_class::<PyPricingResult>()?;
     m.add_class::<EMA>()?;
+    m.add_class::<SMA>()?;
     Ok(())
 }